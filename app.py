@@ -6,13 +6,9 @@ import os
 import json
 import aws_cdk as cdk
 
-from pcluster_cdk.hpc_keypair_stack import HpcKeypairStack
-from pcluster_cdk.hpc_network_stack import HpcNetworkStack
-from pcluster_cdk.hpc_cluster_provider_stack import HpcClusterProviderStack
-from pcluster_cdk.hpc_cluster_stack import HpcClusterStack
-from pcluster_cdk.hpc_efs_stack import HpcEfsStack
-from pcluster_cdk.hpc_lustre_stack import HpcLustreStack
-from pcluster_cdk.hpc_zfs_stack import HpcZfsStack
+from pcluster_cdk.deploy_plan import write_deploy_plan
+from pcluster_cdk.hpc_stacks import build_hpc_stacks
+from pcluster_cdk.synth_profile import SynthProfiler
 
 from cdk_nag import AwsSolutionsChecks, NagSuppressions
 
@@ -29,72 +25,16 @@ deploy_env = cdk.Environment(
     account=os.environ["CDK_DEPLOY_ACCOUNT"], region=os.environ["CDK_DEPLOY_REGION"]
 )
 
-app = cdk.App()
-
-hpc_keypairs = HpcKeypairStack(
-    app,
-    "HpcKeypairs",
-    config=global_config,
-    env=deploy_env,
-)
-
-hpc_network = HpcNetworkStack(
-    app,
-    "HpcNetwork",
-    config=global_config,
-    env=deploy_env,
-)
-
-hpc_efs = HpcEfsStack(
-    scope=app,
-    id="HpcEfsStack",
-    vpc=hpc_network.hpcvpc,
-    config=global_config,
-    env=deploy_env,
-)
-
-hpc_lustre = HpcLustreStack(
-    scope=app,
-    id="HpcLustreStack",
-    vpc=hpc_network.hpcvpc,
-    config=global_config,
-    env=deploy_env,
-)
-
-hpc_zfs = HpcZfsStack(
-    scope=app,
-    id="HpcZfsStack",
-    vpc=hpc_network.hpcvpc,
-    config=global_config,
-    env=deploy_env,
-)
+profiler = SynthProfiler.from_env()
 
-hpc_cluster_provider = HpcClusterProviderStack(
-    app,
-    "HpcClusterProvider",
-    config=global_config,
-    env=deploy_env,
-)
+app = cdk.App()
 
-hpc_cluster_stack = HpcClusterStack(
-    app,
-    "HpcCluster",
-    cluster_provider=hpc_cluster_provider.cluster_provider,
-    vpc=hpc_network.hpcvpc,
-    efs_id=hpc_efs.hpcefs.file_system_id,
-    efs_sg=hpc_efs.hpcefs_sg.security_group_id,
-    lustre_id=hpc_lustre.hpclustre.file_system_id,
-    lustre_sg=hpc_lustre.hpclustre_sg.security_group_id,
-    zfs_id=hpc_zfs.hpczfs.attr_root_volume_id,
-    zfs_sg=hpc_zfs.hpczfs_sg.security_group_id,
-    config=global_config,
-    env=deploy_env,
-)
+stacks = build_hpc_stacks(app, global_config, deploy_env, profiler)
 
-cdk.Aspects.of(app).add(AwsSolutionsChecks())
+cdk.Aspects.of(app).add(profiler.aspect("AwsSolutionsChecks", AwsSolutionsChecks()))
 
 NagSuppressions.add_stack_suppressions(
-    hpc_network,
+    stacks["HpcNetwork"],
     [
         {
             "id": "AwsSolutions-VPC7",
@@ -103,14 +43,57 @@ NagSuppressions.add_stack_suppressions(
     ],
 )
 
-NagSuppressions.add_stack_suppressions(
-    hpc_lustre,
-    [
-        {
-            "id": "AwsSolutions-S1",
-            "reason": "S3 server access logging not desirable for testing.",
-        }
-    ],
-)
-
-app.synth()
+if "HpcLustreStack" in stacks:
+    NagSuppressions.add_stack_suppressions(
+        stacks["HpcLustreStack"],
+        [
+            {
+                "id": "AwsSolutions-S1",
+                "reason": "S3 server access logging not desirable for testing.",
+            }
+        ],
+    )
+
+if "HpcImageBuilder" in stacks:
+    NagSuppressions.add_stack_suppressions(
+        stacks["HpcImageBuilder"],
+        [
+            {
+                "id": "AwsSolutions-IAM4",
+                "reason": "Image Builder build instances use the AWS managed instance profile policies.",
+            }
+        ],
+    )
+
+if "HpcSlurmDb" in stacks:
+    NagSuppressions.add_stack_suppressions(
+        stacks["HpcSlurmDb"],
+        [
+            {
+                "id": "AwsSolutions-SMG4",
+                "reason": "slurmdbd reads the password at configuration time, rotation would lock it out.",
+            },
+            {
+                "id": "AwsSolutions-RDS6",
+                "reason": "slurmdbd authenticates with a database password.",
+            },
+            {
+                "id": "AwsSolutions-RDS10",
+                "reason": "Deletion protection not desirable for testing.",
+            },
+            {
+                "id": "AwsSolutions-RDS11",
+                "reason": "The database is only reachable from the head node security group.",
+            },
+            {
+                "id": "AwsSolutions-RDS14",
+                "reason": "Automated backups are sufficient for accounting data.",
+            },
+        ],
+    )
+
+with profiler.measure("synth"):
+    assembly = app.synth()
+
+profiler.write_report(app, assembly)
+write_deploy_plan(assembly)
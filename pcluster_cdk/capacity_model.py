@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+import os
+
+from pcluster_cdk.efs_settings import efs_config
+from pcluster_cdk.instance_types import instance_spec
+from pcluster_cdk.lustre_profiles import lustre_profile
+from pcluster_cdk.placement import compute_azs, placement_config
+from pcluster_cdk.queues import resource_instance_types
+from pcluster_cdk.storage_backends import STORAGE_BACKENDS, storage_backend
+
+CAPACITY_MODEL_MODES = ("soft", "hard", "off")
+
+# The default config (571 MB/s of storage for 120 nodes at 50 Gbps) has a ratio
+# of about 0.0008, the default threshold only flags fleets well beyond that
+DEFAULT_CAPACITY_MODEL_CONFIG = {"mode": "soft", "min_ratio": 0.0005}
+
+# Baseline MB/s per TiB for deployment types without a per-unit throughput
+SCRATCH_THROUGHPUT_PER_TIB = 200
+
+# EFS throughput the model assumes without a provisioned rate: elastic read
+# throughput, and the 100 MiB/s burst floor of a small bursting filesystem
+EFS_ELASTIC_THROUGHPUT = 3000
+EFS_BURSTING_THROUGHPUT = 105
+
+
+def capacity_model_config(config):
+    model = dict(DEFAULT_CAPACITY_MODEL_CONFIG, **config.get("capacity_model", {}))
+    if model["mode"] not in CAPACITY_MODEL_MODES:
+        raise ValueError(f"capacity_model mode must be one of {CAPACITY_MODEL_MODES}")
+    return model
+
+
+def lustre_throughput(capacity, profile):
+    per_tib = profile["throughput"] or SCRATCH_THROUGHPUT_PER_TIB
+    return per_tib * capacity / 1024
+
+
+def storage_throughput(config):
+    """Peak throughput in MB/s of each shared filesystem the cluster mounts.
+
+    Existing filesystems are only counted when their config gives a throughput.
+    """
+    filesystems = {}
+    for backend, spec in STORAGE_BACKENDS.items():
+        mode = storage_backend(config, backend)
+        if mode == "existing" and "throughput" in config[backend]["existing"]:
+            filesystems[spec["name"]] = config[backend]["existing"]["throughput"]
+        elif mode == "create":
+            filesystems[spec["name"]] = created_throughput(config, backend)
+
+    placement = placement_config(config)
+    if placement["policy"] == "replicate":
+        scratch_profile = lustre_profile({"profile": "scratch-burst"})
+        for az in compute_azs(config):
+            filesystems[f"LustreScratch{az}"] = lustre_throughput(
+                placement["scratch"]["capacity"], scratch_profile
+            )
+
+    return filesystems
+
+
+def created_throughput(config, backend):
+    if backend == "lustre":
+        return lustre_throughput(config["lustre"]["capacity"], lustre_profile(config["lustre"]))
+    if backend == "zfs":
+        return config["zfs"]["throughput"]
+
+    efs = efs_config(config)
+    if efs["throughput_mode"] == "provisioned":
+        return efs["provisioned_mibps"] * 1.048576
+    if efs["throughput_mode"] == "elastic":
+        return EFS_ELASTIC_THROUGHPUT
+    return EFS_BURSTING_THROUGHPUT
+
+
+def compute_demand(slurm_queues):
+    """Peak network bandwidth in MB/s of each queue with every node running."""
+    demand = {}
+    for queue in slurm_queues:
+        demand[queue["Name"]] = sum(
+            int(resource["MaxCount"])
+            * max(
+                instance_spec(instance_type)["network_gbps"]
+                for instance_type in resource_instance_types(resource)
+            )
+            * 125
+            for resource in queue["ComputeResources"]
+        )
+    return demand
+
+
+def capacity_report(config, slurm_queues):
+    filesystems = storage_throughput(config)
+    queues = compute_demand(slurm_queues)
+    total_storage = sum(filesystems.values())
+    total_compute = sum(queues.values())
+    return {
+        "storage_mbps": filesystems,
+        "compute_mbps": queues,
+        "total_storage_mbps": total_storage,
+        "total_compute_mbps": total_compute,
+        "ratio": total_storage / total_compute if total_compute else None,
+        "min_ratio": capacity_model_config(config)["min_ratio"],
+    }
+
+
+def render_markdown(report):
+    lines = [
+        "# Storage vs compute bandwidth",
+        "",
+        "| Filesystem | Peak MB/s |",
+        "| --- | ---: |",
+    ]
+    lines += [f"| {name} | {mbps:,.0f} |" for name, mbps in report["storage_mbps"].items()]
+    lines += ["", "| Queue | Peak network MB/s |", "| --- | ---: |"]
+    lines += [f"| {name} | {mbps:,.0f} |" for name, mbps in report["compute_mbps"].items()]
+    ratio = "n/a" if report["ratio"] is None else f"{report['ratio']:.4f}"
+    lines += [
+        "",
+        f"Storage {report['total_storage_mbps']:,.0f} MB/s vs compute "
+        f"{report['total_compute_mbps']:,.0f} MB/s: ratio {ratio} "
+        f"(minimum {report['min_ratio']})",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def write_report(report, outdir, name):
+    os.makedirs(outdir, exist_ok=True)
+    with open(os.path.join(outdir, f"{name}.capacity-model.json"), "w") as report_json:
+        json.dump(report, report_json, indent=2)
+    with open(os.path.join(outdir, f"{name}.capacity-model.md"), "w") as report_md:
+        report_md.write(render_markdown(report))
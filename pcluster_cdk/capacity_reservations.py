@@ -0,0 +1,59 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+RESERVATION_KINDS = ("create", "id", "resource_group_arn")
+
+
+def capacity_reservations_config(config):
+    """Validated capacity reservations from config["capacity_reservations"], by name."""
+    reservations = {}
+    for name, reservation in config.get("capacity_reservations", {}).items():
+        kinds = [
+            kind
+            for kind in RESERVATION_KINDS
+            if reservation.get(kind) not in (None, False)
+        ]
+        if len(kinds) != 1:
+            raise ValueError(
+                f"Capacity reservation '{name}' must set exactly one of {RESERVATION_KINDS}"
+            )
+        if kinds[0] == "create":
+            for key in ("instance_type", "az", "count"):
+                if key not in reservation:
+                    raise ValueError(f"Capacity reservation '{name}' to create needs '{key}'")
+            if "placement_group" in reservation:
+                raise ValueError(
+                    f"Capacity reservation '{name}' to create is not in a placement group, "
+                    "only existing reservations can set 'placement_group'"
+                )
+        elif "az" not in reservation and "availability_zone" not in reservation:
+            raise ValueError(
+                f"Capacity reservation '{name}' needs its 'az' index or 'availability_zone' name"
+            )
+        reservations[name] = dict(reservation, kind=kinds[0])
+    return reservations
+
+
+def validate_reservation_placement(
+    reservation_name, reservation, queue_name, capacity_type, az, subnet_az, instance_types
+):
+    if capacity_type != "ONDEMAND":
+        raise ValueError(
+            f"Queue '{queue_name}' targets capacity reservation '{reservation_name}' "
+            f"but uses {capacity_type} capacity"
+        )
+    if "az" in reservation and reservation["az"] != az:
+        raise ValueError(
+            f"Queue '{queue_name}' is in AZ index {az} but capacity reservation "
+            f"'{reservation_name}' is in AZ index {reservation['az']}"
+        )
+    if "availability_zone" in reservation and reservation["availability_zone"] != subnet_az:
+        raise ValueError(
+            f"Queue '{queue_name}' subnet is in {subnet_az} but capacity reservation "
+            f"'{reservation_name}' is in {reservation['availability_zone']}"
+        )
+    if "instance_type" in reservation and reservation["instance_type"] not in instance_types:
+        raise ValueError(
+            f"Capacity reservation '{reservation_name}' is for {reservation['instance_type']}, "
+            f"queue '{queue_name}' runs {', '.join(instance_types)}"
+        )
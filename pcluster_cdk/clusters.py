@@ -0,0 +1,52 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import re
+
+# Built once by app.py and shared by every cluster, so clusters cannot override them
+SHARED_KEYS = (
+    "vpc",
+    "efs",
+    "lustre",
+    "zfs",
+    "placement",
+    "images",
+    "slurm_db",
+    "capacity_reservations",
+    "pcluster",
+    "parameter_root",
+    "key_material",
+)
+
+CLUSTER_LABEL_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9-]{0,59}$")
+
+
+def cluster_configs(config):
+    """Config of every cluster, each entry in config["clusters"] overriding cluster settings."""
+    if "clusters" not in config:
+        return [config]
+
+    base = {key: value for key, value in config.items() if key != "clusters"}
+    clusters = []
+    for entry in config["clusters"]:
+        if not CLUSTER_LABEL_PATTERN.match(entry.get("label", "")):
+            raise ValueError(
+                f"Cluster label '{entry.get('label')}' must start with a letter and "
+                "contain only letters, digits or '-', at most 60 characters"
+            )
+        shared = sorted(set(entry) & set(SHARED_KEYS))
+        if shared:
+            raise ValueError(
+                f"Cluster '{entry['label']}' cannot override shared settings {', '.join(shared)}"
+            )
+        if any(cluster["label"] == entry["label"] for cluster in clusters):
+            raise ValueError(f"Cluster label '{entry['label']}' is used more than once")
+        clusters.append(dict(base, **entry))
+    return clusters
+
+
+def cluster_stack_id(config, cluster_config):
+    """HpcCluster for a single cluster, HpcCluster-<label> for each of a clusters list."""
+    if "clusters" not in config:
+        return "HpcCluster"
+    return f"HpcCluster-{cluster_config['label']}"
@@ -0,0 +1,22 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+# auto: offload once the serialized cluster configuration exceeds threshold_kb
+OFFLOAD_MODES = ("auto", "always", "never")
+
+DEFAULT_OFFLOAD_CONFIG = {"mode": "auto", "threshold_kb": 256}
+
+
+def offload_config(config):
+    offload = dict(DEFAULT_OFFLOAD_CONFIG, **config.get("cluster_config_offload", {}))
+    if offload["mode"] not in OFFLOAD_MODES:
+        raise ValueError(f"cluster_config_offload mode must be one of {OFFLOAD_MODES}")
+    if offload["threshold_kb"] <= 0:
+        raise ValueError("cluster_config_offload threshold_kb must be positive")
+    return offload
+
+
+def should_offload(offload, size_bytes):
+    if offload["mode"] == "auto":
+        return size_bytes > offload["threshold_kb"] * 1024
+    return offload["mode"] == "always"
@@ -0,0 +1,60 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+import os
+
+PLAN_NAME = "deploy-waves"
+
+
+def deploy_waves(dependencies):
+    """Group stacks into waves, each wave only depends on stacks in earlier waves.
+
+    dependencies maps each stack name to the names of the stacks it depends on.
+    """
+    waves = []
+    deployed = set()
+    remaining = dict(dependencies)
+    while remaining:
+        wave = sorted(name for name, needs in remaining.items() if needs <= deployed)
+        if not wave:
+            raise ValueError(f"Stacks {', '.join(sorted(remaining))} have circular dependencies")
+        waves.append(wave)
+        deployed.update(wave)
+        for name in wave:
+            del remaining[name]
+    return waves
+
+
+def assembly_dependencies(assembly):
+    stack_names = {stack.id for stack in assembly.stacks}
+    return {
+        stack.id: {
+            dependency.id for dependency in stack.dependencies if dependency.id in stack_names
+        }
+        for stack in assembly.stacks
+    }
+
+
+def render_markdown(plan):
+    lines = ["# Deploy waves", ""]
+    for index, wave in enumerate(plan["waves"], start=1):
+        lines.append(f"{index}. {', '.join(wave)}")
+    lines += ["", f"Deploy with `{plan['command']}`", ""]
+    return "\n".join(lines)
+
+
+def write_deploy_plan(assembly):
+    """Write deploy-waves.json/.md next to the templates and return the plan."""
+    waves = deploy_waves(assembly_dependencies(assembly))
+    concurrency = max(len(wave) for wave in waves)
+    plan = {
+        "waves": waves,
+        "concurrency": concurrency,
+        "command": f"cdk deploy --all --concurrency {concurrency}",
+    }
+    with open(os.path.join(assembly.directory, PLAN_NAME + ".json"), "w") as plan_json:
+        json.dump(plan, plan_json, indent=2)
+    with open(os.path.join(assembly.directory, PLAN_NAME + ".md"), "w") as plan_md:
+        plan_md.write(render_markdown(plan))
+    return plan
@@ -0,0 +1,42 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+EFS_THROUGHPUT_MODES = ("bursting", "provisioned", "elastic")
+EFS_PERFORMANCE_MODES = ("general_purpose", "max_io")
+
+DEFAULT_EFS_CONFIG = {
+    "throughput_mode": "bursting",
+    "performance_mode": "general_purpose",
+    "one_zone": False,
+}
+
+
+def efs_config(config):
+    """Return the validated EFS settings from config["efs"]."""
+    efs = dict(DEFAULT_EFS_CONFIG, **config.get("efs", {}))
+    throughput_mode = efs["throughput_mode"]
+    performance_mode = efs["performance_mode"]
+
+    if throughput_mode not in EFS_THROUGHPUT_MODES:
+        raise ValueError(
+            f"EFS throughput_mode must be one of {EFS_THROUGHPUT_MODES}, got '{throughput_mode}'"
+        )
+    if performance_mode not in EFS_PERFORMANCE_MODES:
+        raise ValueError(
+            f"EFS performance_mode must be one of {EFS_PERFORMANCE_MODES}, got '{performance_mode}'"
+        )
+
+    if throughput_mode == "provisioned":
+        if efs.get("provisioned_mibps", 0) < 1:
+            raise ValueError("EFS provisioned throughput needs provisioned_mibps of at least 1")
+    elif "provisioned_mibps" in efs:
+        raise ValueError(
+            f"EFS provisioned_mibps is only valid with provisioned throughput, not {throughput_mode}"
+        )
+
+    if performance_mode == "max_io" and throughput_mode == "elastic":
+        raise ValueError("EFS elastic throughput is not supported with the max_io performance mode")
+    if performance_mode == "max_io" and efs["one_zone"]:
+        raise ValueError("EFS One Zone filesystems do not support the max_io performance mode")
+
+    return efs
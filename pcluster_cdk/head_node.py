@@ -0,0 +1,86 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from pcluster_cdk.instance_types import instance_spec
+from pcluster_cdk.queues import resource_instance_types
+
+# (max nodes, max vCPUs, max queues) -> (instance type, root volume GiB)
+# The first tier covering all three totals is used, the last covers any fleet
+HEAD_NODE_SIZES = [
+    ((32, 4096, 10), ("m7i-flex.large", 100)),
+    ((128, 16384, 20), ("m7i.xlarge", 100)),
+    ((512, 65536, 50), ("m7i.2xlarge", 200)),
+    ((1024, 131072, 100), ("m7i.4xlarge", 300)),
+    ((None, None, None), ("m7i.8xlarge", 500)),
+]
+
+# Head node of clusters without head_node settings. InstanceType and the root
+# volume cannot be updated on a deployed cluster, so the table is only applied
+# when asked for.
+DEFAULT_HEAD_NODE = ("m7i-flex.large", 100)
+
+
+def fleet_size(slurm_queues):
+    """Total max nodes, total vCPUs at max nodes and queue count of the fleet."""
+    nodes = 0
+    vcpus = 0
+    for queue in slurm_queues:
+        for compute_resource in queue["ComputeResources"]:
+            max_count = int(compute_resource["MaxCount"])
+            nodes += max_count
+            vcpus += max_count * max(
+                instance_spec(instance_type)["vcpus"]
+                for instance_type in resource_instance_types(compute_resource)
+            )
+    return nodes, vcpus, len(slurm_queues)
+
+
+def recommended_head_node(fleet):
+    for limits, size in HEAD_NODE_SIZES:
+        if all(limit is None or total <= limit for total, limit in zip(fleet, limits)):
+            return size
+
+
+def is_smaller(instance_type, than):
+    spec = instance_spec(instance_type)
+    than_spec = instance_spec(than)
+    return spec["vcpus"] < than_spec["vcpus"] or spec["memory_mib"] < than_spec["memory_mib"]
+
+
+def head_node_size(config, fleet):
+    """(instance type, root volume GiB, warnings).
+
+    With head_node set the table sizes the head node and explicit settings
+    win, without it the head node stays at DEFAULT_HEAD_NODE.
+    """
+    instance_type, root_volume_size = recommended_head_node(fleet)
+    label = "{:,} nodes, {:,} vCPUs and {} queues".format(*fleet)
+
+    if "head_node" not in config:
+        default_type, default_size = DEFAULT_HEAD_NODE
+        if is_smaller(default_type, instance_type) or default_size < root_volume_size:
+            return (
+                default_type,
+                default_size,
+                [
+                    f"Head node {default_type} with {default_size} GiB is smaller than "
+                    f"{instance_type} with {root_volume_size} GiB recommended for {label}. "
+                    "Set head_node to size new clusters, a deployed head node cannot be changed"
+                ],
+            )
+        return default_type, default_size, []
+
+    head_node = config["head_node"]
+    warnings = []
+    override_type = head_node.get("instance_type", instance_type)
+    if override_type != instance_type and is_smaller(override_type, instance_type):
+        warnings.append(
+            f"Head node {override_type} is smaller than {instance_type} recommended for {label}"
+        )
+    override_size = head_node.get("root_volume_size", root_volume_size)
+    if override_size < root_volume_size:
+        warnings.append(
+            f"Head node root volume of {override_size} GiB is smaller than "
+            f"{root_volume_size} GiB recommended for {label}"
+        )
+    return override_type, override_size, warnings
@@ -0,0 +1,35 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from constructs import Construct
+from aws_cdk import Stack, aws_ec2 as ec2, CfnOutput
+
+from pcluster_cdk.capacity_reservations import capacity_reservations_config
+
+
+class HpcCapacityReservationStack(Stack):
+    def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
+        super().__init__(scope, id, **kwargs)
+
+        self.capacity_reservations = {}
+
+        for name, reservation in capacity_reservations_config(config).items():
+            if reservation["kind"] != "create":
+                continue
+
+            self.capacity_reservations[name] = ec2.CfnCapacityReservation(
+                self,
+                f"HPC_ODCR_{name}",
+                availability_zone=vpc.private_subnets[reservation["az"]].availability_zone,
+                instance_type=reservation["instance_type"],
+                instance_count=reservation["count"],
+                instance_platform="Linux/UNIX",
+                instance_match_criteria="targeted",
+                ebs_optimized=True,
+            )
+
+            CfnOutput(
+                self,
+                f"CapacityReservationId{name}",
+                value=self.capacity_reservations[name].ref,
+            )
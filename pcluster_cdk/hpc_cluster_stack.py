@@ -1,8 +1,67 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
 
+import json
+import os
+
 from constructs import Construct
-from aws_cdk import Stack, CustomResource, RemovalPolicy
+from aws_cdk import (
+    Stack,
+    Stage,
+    Annotations,
+    CustomResource,
+    RemovalPolicy,
+    Reference,
+    Token,
+    Tokenization,
+    aws_ec2 as ec2,
+    aws_s3_assets as s3_assets,
+    aws_ssm as ssm,
+)
+
+from pcluster_cdk.capacity_model import (
+    capacity_model_config,
+    capacity_report,
+    write_report,
+)
+from pcluster_cdk.capacity_reservations import (
+    capacity_reservations_config,
+    validate_reservation_placement,
+)
+from pcluster_cdk.config_offload import offload_config, should_offload
+from pcluster_cdk.efs_settings import efs_config
+from pcluster_cdk.head_node import fleet_size, head_node_size
+from pcluster_cdk.images import images_config
+from pcluster_cdk.instance_types import instance_spec
+from pcluster_cdk.lustre_data import preload_args, preload_config
+from pcluster_cdk.node_tuning import render_tuning_script, tuning_config
+from pcluster_cdk.placement import (
+    cross_az_queues,
+    placed_compute_config,
+    placement_config,
+)
+from pcluster_cdk.queues import (
+    build_slurm_queues,
+    ephemeral_scratch_gb,
+    expand_queue_matrix,
+    queue_option,
+    resource_instance_types,
+)
+from pcluster_cdk.scaling import (
+    MAX_WARM_WINDOWS_BYTES,
+    idle_node_hours,
+    scaling_config,
+    validate_warm_window,
+    warm_window_cron,
+)
+from pcluster_cdk.storage_backends import (
+    STORAGE_BACKENDS,
+    created_backends,
+    shared_storage_entry,
+    storage_backend,
+)
+
+NODE_SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "node_scripts")
 
 
 class HpcClusterStack(Stack):
@@ -12,33 +71,55 @@ class HpcClusterStack(Stack):
         construct_id: str,
         cluster_provider,
         vpc,
-        efs_id,
-        efs_sg,
-        lustre_id,
-        lustre_sg,
-        zfs_id,
-        zfs_sg,
         config: dict,
+        shared_storage=None,
+        lustre_scratch=None,
+        zfs_volumes=(),
+        capacity_reservations=None,
+        images=None,
+        slurm_db=None,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
         pcluster_controller_subnet = vpc.public_subnets[0].subnet_id
-        # We use all 3 AZs for compute, so can just list in order
-        pcluster_compute_subnet_1 = vpc.private_subnets[0].subnet_id
-        pcluster_compute_subnet_2 = vpc.private_subnets[1].subnet_id
-        pcluster_compute_subnet_3 = vpc.private_subnets[2].subnet_id
+        # Queues reference compute subnets by AZ index, in private subnet order
+        pcluster_compute_subnets = [subnet.subnet_id for subnet in vpc.private_subnets]
+
+        # Filesystems built by this app come in shared_storage, existing ones from config
+        self.storage = {}
+        for backend in STORAGE_BACKENDS:
+            mode = storage_backend(config, backend)
+            if mode == "create":
+                self.storage[backend] = shared_storage[backend]
+            elif mode == "existing":
+                existing = config[backend]["existing"]
+                self.storage[backend] = {
+                    "id": existing[STORAGE_BACKENDS[backend]["existing_id"]],
+                    "security_group": existing["security_group_id"],
+                }
+        placement = placement_config(config)
+        if placement["policy"] == "replicate" and not lustre_scratch:
+            raise ValueError("Placement policy replicate needs the Lustre filesystem built by this app")
 
-        self.additional_security_groups = [efs_sg, lustre_sg, zfs_sg]
+        self.additional_security_groups = [
+            storage["security_group"] for storage in self.storage.values()
+        ]
 
         self.slurm_settings = {
             "QueueUpdateStrategy": "DRAIN",
-            "ScaledownIdletime": "5",
+            "ScaledownIdletime": str(scaling_config(config)["idle_timeout"]),
             "CustomSlurmSettings": [
                 {"JobRequeue": "0"},
             ],
         }
 
+        # slurmdbd runs on the head node, only it reaches the accounting database
+        self.head_node_security_groups = list(self.additional_security_groups)
+        if slurm_db:
+            self.slurm_settings["Database"] = slurm_db["settings"]
+            self.head_node_security_groups.append(slurm_db["security_group"])
+
         self.ebs_settings = {
             "Encrypted": "true",
             "VolumeType": "gp3",
@@ -61,32 +142,90 @@ class HpcClusterStack(Stack):
         self.common_compute_settings = {
             "MinCount": "0",
             "DisableSimultaneousMultithreading": "true",
-            "Efa": {"Enabled": "true"},
             "Networking": self.compute_resource_networking_settings,
         }
 
-        self.c6i_settings = {
-            "Name": "c6i",
-            "InstanceType": "c6i.32xlarge",
-            **self.common_compute_settings,
+        compute_config = placed_compute_config(config)
+        queue_azs = {
+            name: az for name, _, _, az, _ in expand_queue_matrix(compute_config)
         }
 
-        self.c7i_settings = {
-            "Name": "c7i",
-            "InstanceType": "c7i.48xlarge",
-            **self.common_compute_settings,
+        # EFA needs all traffic allowed between the nodes that use it
+        self.efa_sg = ec2.SecurityGroup(
+            self,
+            "HPC_SG_EFA",
+            vpc=vpc,
+            allow_all_outbound=True,
+        )
+        self.efa_sg.add_ingress_rule(
+            self.efa_sg, ec2.Port.all_traffic(), "Allow all traffic between EFA nodes"
+        )
+
+        self.placement_groups = {}
+        self.capacity_reservations = capacity_reservations_config(config)
+        self.capacity_reservation_ids = capacity_reservations or {}
+        self.compute_subnets = vpc.private_subnets
+        self.images = {
+            name: {"ami": images[name], "architecture": image["architecture"]}
+            for name, image in images_config(config).items()
         }
 
+        self.slurm_queues = build_slurm_queues(
+            compute_config,
+            pcluster_compute_subnets,
+            self.compute_settings,
+            self.common_compute_settings,
+            self.additional_security_groups,
+            efa_security_group=self.efa_sg.security_group_id,
+            placement_group=self.placement_group,
+            capacity_reservation_target=self.capacity_reservation_target,
+            images=self.images,
+            shared_mount_dirs=[volume["mount_dir"] for volume in zfs_volumes]
+            + ([placement["scratch"]["mount_dir"]] if lustre_scratch else []),
+        )
+
+        self._script_assets = {}
+        if lustre_scratch:
+            for queue in self.slurm_queues:
+                scratch = lustre_scratch[queue_azs[queue["Name"]]]
+                self.add_node_configured_action(
+                    queue,
+                    "mount_lustre.sh",
+                    [scratch.dns_name, scratch.mount_name, placement["scratch"]["mount_dir"]],
+                )
+
+        # EFS has a mount target in every AZ unless it is One Zone
+        single_az_storage = [
+            STORAGE_BACKENDS[backend]["name"]
+            for backend in created_backends(config)
+            if backend != "efs" or efs_config(config)["one_zone"]
+        ]
+        cross_az = cross_az_queues(queue_azs, placement["storage_az"]) if single_az_storage else {}
+        for az, queue_names in sorted(cross_az.items()):
+            Annotations.of(self).add_info(
+                f"Queues {', '.join(queue_names)} in AZ index {az} cross AZs to reach "
+                f"{', '.join(single_az_storage)} in AZ index {placement['storage_az']}"
+            )
+
+        # slurmctld and the ParallelCluster daemons scale with the fleet
+        head_node_type, head_node_volume_size, head_node_warnings = head_node_size(
+            config, fleet_size(self.slurm_queues)
+        )
+        for warning in head_node_warnings:
+            Annotations.of(self).add_warning(warning)
+
         self.cluster_config = {
             "Image": {"Os": "alinux2"},
             "HeadNode": {
-                "InstanceType": "m7i-flex.large",
+                "InstanceType": head_node_type,
                 "LocalStorage": {
-                    "RootVolume": dict({"Size": "100"}, **self.ebs_settings)
+                    "RootVolume": dict(
+                        {"Size": str(head_node_volume_size)}, **self.ebs_settings
+                    )
                 },
                 "Networking": {
                     "SubnetId": pcluster_controller_subnet,
-                    "AdditionalSecurityGroups": self.additional_security_groups,
+                    "AdditionalSecurityGroups": self.head_node_security_groups,
                 },
                 "Ssh": {
                     "KeyName": config["key_name"],
@@ -97,109 +236,102 @@ class HpcClusterStack(Stack):
             "Scheduling": {
                 "Scheduler": "slurm",
                 "SlurmSettings": self.slurm_settings,
-                "SlurmQueues": [
-                    {
-                        "Name": "icl1",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c6i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_1],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                    {
-                        "Name": "icl2",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c6i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_2],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                    {
-                        "Name": "icl3",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c6i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_3],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                    {
-                        "Name": "spr1",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c7i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_1],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                    {
-                        "Name": "spr2",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c7i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_2],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                    {
-                        "Name": "spr3",
-                        "CapacityType": "ONDEMAND",
-                        "JobExclusiveAllocation": "true",
-                        "ComputeSettings": self.compute_settings,
-                        "ComputeResources": [
-                            dict({"MaxCount": "20"}, **self.c7i_settings)
-                        ],
-                        "Networking": {
-                            "SubnetIds": [pcluster_compute_subnet_3],
-                            "AdditionalSecurityGroups": self.additional_security_groups,
-                        }
-                    },
-                ],
+                "SlurmQueues": self.slurm_queues,
             },
             "SharedStorage": [
+                shared_storage_entry(backend, storage["id"])
+                for backend, storage in self.storage.items()
+            ]
+            + [
                 {
-                    "Name": "EfsFromCDK",
-                    "StorageType": "Efs",
-                    "MountDir": "/efs",
-                    "EfsSettings": {"FileSystemId": efs_id},
-                },
-                {
-                    "Name": "LustreFromCDK",
-                    "StorageType": "FsxLustre",
-                    "MountDir": "/lustre",
-                    "FsxLustreSettings": {"FileSystemId": lustre_id},
-                },
-                {
-                    "Name": "ZfsFromCDK",
+                    "Name": f"Zfs-{volume['name']}",
                     "StorageType": "FsxOpenZfs",
-                    "MountDir": "/zfs",
-                    "FsxOpenZfsSettings": {"VolumeId": zfs_id},
-                },
+                    "MountDir": volume["mount_dir"],
+                    "FsxOpenZfsSettings": {"VolumeId": volume["volume_id"]},
+                }
+                for volume in zfs_volumes
             ],
         }
 
+        # Fails synth for instance types missing from the bundled catalog
+        head_node_spec = instance_spec(self.cluster_config["HeadNode"]["InstanceType"])
+
+        if "image" in config:
+            if config["image"] not in self.images:
+                raise ValueError(f"Cluster image '{config['image']}' is not declared in images")
+            cluster_image = self.images[config["image"]]
+            if cluster_image["architecture"] != head_node_spec["architecture"]:
+                raise ValueError(
+                    f"Cluster image '{config['image']}' is built for "
+                    f"{cluster_image['architecture']} but the head node is "
+                    f"{head_node_spec['architecture']}"
+                )
+            self.cluster_config["Image"]["CustomAmi"] = cluster_image["ami"]
+
+        capacity_model = capacity_model_config(config)
+        if capacity_model["mode"] != "off":
+            report = capacity_report(config, self.slurm_queues)
+            write_report(report, Stage.of(self).outdir, self.stack_name)
+            if report["ratio"] is not None and report["ratio"] < capacity_model["min_ratio"]:
+                message = (
+                    f"Shared storage peaks at {report['total_storage_mbps']:,.0f} MB/s against "
+                    f"{report['total_compute_mbps']:,.0f} MB/s of compute network bandwidth, "
+                    f"ratio {report['ratio']:.4f} is below {capacity_model['min_ratio']}"
+                )
+                if capacity_model["mode"] == "hard":
+                    raise ValueError(message)
+                Annotations.of(self).add_warning(message)
+
+        self.add_warm_pool_schedules(
+            compute_config, f"{config['parameter_root']}/{config['label']}/warm_windows"
+        )
+        self.report_ephemeral_scratch(compute_config)
+
+        tuning = tuning_config(config)
+        if tuning:
+            nfs_mounts = {
+                STORAGE_BACKENDS[backend]["mount_dir"]: tuning.get(backend, {})
+                for backend in ("efs", "zfs")
+                if backend in self.storage
+            }
+            nfs_mounts.update(
+                {volume["mount_dir"]: tuning.get("zfs", {}) for volume in zfs_volumes}
+            )
+            lustre_mount_dir = "/lustre" if "lustre" in self.storage else None
+            # Generated next to the templates, overwritten by every synth
+            scripts_dir = os.path.join(Stage.of(self).outdir, f"{self.stack_name}.node-scripts")
+            os.makedirs(scripts_dir, exist_ok=True)
+            for script, head_node in (
+                ("tune_head_node.sh", True),
+                ("tune_compute_node.sh", False),
+            ):
+                with open(os.path.join(scripts_dir, script), "w") as script_file:
+                    script_file.write(
+                        render_tuning_script(tuning, nfs_mounts, lustre_mount_dir, head_node)
+                    )
+            self.add_node_configured_action(
+                self.cluster_config["HeadNode"], "tune_head_node.sh", [], scripts_dir
+            )
+            for queue in self.slurm_queues:
+                self.add_node_configured_action(queue, "tune_compute_node.sh", [], scripts_dir)
+
+        # Hydrate Lustre on the head node, the cluster only completes once it is done
+        lustre_preload = (
+            preload_config(config["lustre"])
+            if storage_backend(config, "lustre") == "create"
+            else {"paths": []}
+        )
+        if lustre_preload["paths"]:
+            self.add_node_configured_action(
+                self.cluster_config["HeadNode"],
+                "preload_lustre.sh",
+                preload_args(lustre_preload, "/lustre"),
+            )
+            # The head node bootstrap includes the preload, past the 30 minute default
+            self.cluster_config.setdefault("DevSettings", {}).setdefault("Timeouts", {})[
+                "HeadNodeBootstrapTimeout"
+            ] = lustre_preload["timeout_minutes"] * 60
+
         self.pcluster = CustomResource(
             self,
             "HPC_CLUSTER",
@@ -209,6 +341,195 @@ class HpcClusterStack(Stack):
             pascal_case_properties=True,
             properties={
                 "ClusterName": config["label"],
-                "ClusterConfiguration": self.cluster_config,
+                "ClusterConfiguration": self.cluster_configuration(config),
             },
         )
+
+    def cluster_configuration(self, config):
+        """Inline cluster config, or an AWS::Include of it from an S3 asset when large."""
+        document = json.dumps(self.resolve(self.cluster_config), sort_keys=True)
+        offload = offload_config(config)
+        if not should_offload(offload, len(document)):
+            return self.cluster_config
+
+        # The included snippet is resolved in this stack, so references to
+        # other stacks have to become imports before it is serialized
+        document = json.dumps(
+            self.resolve(self.import_references(self.cluster_config)), sort_keys=True
+        )
+        config_path = os.path.join(Stage.of(self).outdir, f"{self.stack_name}.cluster-config.json")
+        with open(config_path, "w") as config_json:
+            config_json.write(document)
+        asset = s3_assets.Asset(self, "HPC_CLUSTER_CONFIG", path=config_path)
+        if Token.is_unresolved(asset.s3_object_url):
+            raise ValueError(
+                "Offloading the cluster configuration needs an explicit account and region"
+            )
+        Annotations.of(self).add_info(
+            f"Cluster configuration is {len(document) / 1024:,.0f} KiB, "
+            f"included from {asset.s3_object_url}"
+        )
+        return {
+            "Fn::Transform": {
+                "Name": "AWS::Include",
+                "Parameters": {"Location": asset.s3_object_url},
+            }
+        }
+
+    def import_references(self, value):
+        if isinstance(value, dict):
+            return {key: self.import_references(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.import_references(item) for item in value]
+        if not isinstance(value, str) or not Token.is_unresolved(value):
+            return value
+
+        fragments = Tokenization.reverse_string(value)
+        producers = {
+            Stack.of(token.target)
+            for token in fragments.tokens
+            if isinstance(token, Reference) and Stack.of(token.target) != self
+        }
+        if not producers:
+            return value
+        if fragments.length > 1:
+            raise ValueError(
+                "Cannot offload a cluster configuration value that combines "
+                "references to other stacks with other text"
+            )
+        return producers.pop().export_value(value)
+
+    def placement_group(self, queue_name, compute_resource_name):
+        key = f"{queue_name}-{compute_resource_name}"
+        self.placement_groups[key] = ec2.CfnPlacementGroup(
+            self, f"HPC_PG_{key}", strategy="cluster"
+        )
+        return self.placement_groups[key].ref
+
+    def capacity_reservation_target(
+        self, queue_name, reservation_name, capacity_type, az, instance_types
+    ):
+        if reservation_name not in self.capacity_reservations:
+            raise ValueError(
+                f"Queue '{queue_name}' references undeclared capacity reservation '{reservation_name}'"
+            )
+        reservation = self.capacity_reservations[reservation_name]
+        validate_reservation_placement(
+            reservation_name,
+            reservation,
+            queue_name,
+            capacity_type,
+            az,
+            self.compute_subnets[az].availability_zone,
+            instance_types,
+        )
+
+        if reservation["kind"] == "resource_group_arn":
+            target = {"CapacityReservationResourceGroupArn": reservation["resource_group_arn"]}
+        elif reservation["kind"] == "create":
+            target = {"CapacityReservationId": self.capacity_reservation_ids[reservation_name].ref}
+        else:
+            target = {"CapacityReservationId": reservation["id"]}
+        return target, reservation.get("placement_group")
+
+    def add_warm_pool_schedules(self, compute_config, parameter_name):
+        queues = {queue["Name"]: queue for queue in self.slurm_queues}
+        idle_nodes = 0
+        idle_hours = 0
+        cron_lines = []
+        for name, _, _, _, entry in expand_queue_matrix(compute_config):
+            compute_resource = queues[name]["ComputeResources"][0]
+            static_nodes = int(compute_resource.get("MinCount", "0"))
+            dynamic_nodes = int(compute_resource["MaxCount"]) - static_nodes
+            windows = queue_option(entry, name, "warm_windows", [])
+            for window in windows:
+                validate_warm_window(name, window, dynamic_nodes)
+                cron_lines += warm_window_cron(name, compute_resource["Name"], window)
+            if not static_nodes and not windows:
+                continue
+
+            hours = idle_node_hours(static_nodes, windows)
+            idle_nodes += static_nodes + max((w["nodes"] for w in windows), default=0)
+            idle_hours += hours
+            suspend_time = queues[name].get("CustomSlurmSettings", {}).get("SuspendTime")
+            idle_timeout = (
+                int(suspend_time) // 60
+                if suspend_time
+                else self.slurm_settings["ScaledownIdletime"]
+            )
+            Annotations.of(self).add_info(
+                f"Queue {name} keeps {static_nodes} static nodes and "
+                f"{', '.join(str(w['nodes']) for w in windows) or 'no'} windowed warm nodes, "
+                f"up to {hours} idle node-hours per week; "
+                f"dynamic nodes scale down after {idle_timeout} minutes idle"
+            )
+        if idle_nodes:
+            Annotations.of(self).add_info(
+                f"Warm pools keep up to {idle_nodes} nodes ready without boot latency, "
+                f"up to {idle_hours} idle node-hours per week across the cluster"
+            )
+
+        if cron_lines:
+            # The head node syncs the windows from SSM, so editing them is an
+            # ordinary stack update rather than a change to the cluster config
+            cron = "\n".join(cron_lines) + "\n"
+            if len(cron) > MAX_WARM_WINDOWS_BYTES:
+                raise ValueError(
+                    f"Warm windows need {len(cron):,} bytes of cron lines, "
+                    f"more than the {MAX_WARM_WINDOWS_BYTES:,} an SSM parameter holds"
+                )
+            parameter = ssm.StringParameter(
+                self,
+                "HPC_WARM_WINDOWS_PARAMETER",
+                parameter_name=parameter_name,
+                string_value=cron,
+                tier=(
+                    ssm.ParameterTier.ADVANCED
+                    if len(cron) > 4096
+                    else ssm.ParameterTier.STANDARD
+                ),
+            )
+            self.add_node_configured_action(
+                self.cluster_config["HeadNode"],
+                "warm_pool_schedule.sh",
+                [parameter.parameter_name, self.region],
+            )
+
+    def report_ephemeral_scratch(self, compute_config):
+        queues = {queue["Name"]: queue for queue in self.slurm_queues}
+        for name, _, _, _, entry in expand_queue_matrix(compute_config):
+            if not queue_option(entry, name, "ephemeral_scratch"):
+                continue
+            instance_types = resource_instance_types(queues[name]["ComputeResources"][0])
+            local_storage = queues[name]["ComputeSettings"]["LocalStorage"]
+            if "EphemeralVolume" in local_storage:
+                Annotations.of(self).add_info(
+                    f"Queue {name} mounts {ephemeral_scratch_gb(instance_types):,} GB of NVMe "
+                    f"scratch per node at {local_storage['EphemeralVolume']['MountDir']}"
+                )
+            else:
+                Annotations.of(self).add_info(
+                    f"Queue {name} opts into ephemeral scratch but {', '.join(instance_types)} "
+                    "has no NVMe instance store, temporary I/O stays on shared storage"
+                )
+
+    def add_node_configured_action(
+        self, node_settings, script, args, scripts_dir=NODE_SCRIPTS_DIR
+    ):
+        if script not in self._script_assets:
+            self._script_assets[script] = s3_assets.Asset(
+                self,
+                f"HPC_NODE_SCRIPT_{script}",
+                path=os.path.join(scripts_dir, script),
+            )
+        asset = self._script_assets[script]
+
+        custom_actions = node_settings.setdefault("CustomActions", {})
+        on_node_configured = custom_actions.setdefault("OnNodeConfigured", {"Sequence": []})
+        on_node_configured["Sequence"].append(
+            {"Script": asset.s3_object_url, "Args": args}
+        )
+
+        s3_access = node_settings.setdefault("Iam", {}).setdefault("S3Access", [])
+        if not any(access["BucketName"] == asset.s3_bucket_name for access in s3_access):
+            s3_access.append({"BucketName": asset.s3_bucket_name})
@@ -9,13 +9,19 @@ from aws_cdk import (
     aws_ssm as ssm,
     CfnOutput,
     RemovalPolicy,
+    Size,
 )
 
+from pcluster_cdk.efs_settings import efs_config
+from pcluster_cdk.placement import storage_subnet
+
 
 class HpcEfsStack(Stack):
     def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
         super().__init__(scope, id, **kwargs)
 
+        efs_settings = efs_config(config)
+
         self.hpcefs_sg = ec2.SecurityGroup(
             self,
             "HPC_SG_EFS",
@@ -27,6 +33,8 @@ class HpcEfsStack(Stack):
             self.hpcefs_sg, ec2.Port.tcp(2049), "Allow NFS connection to EFS"
         )
 
+        one_zone_subnet = storage_subnet(vpc, config) if efs_settings["one_zone"] else None
+
         self.hpcefs = efs.FileSystem(
             self,
             "HPC_EFS",
@@ -34,10 +42,29 @@ class HpcEfsStack(Stack):
             security_group=self.hpcefs_sg,
             enable_automatic_backups=True,
             encrypted=True,
-            performance_mode=efs.PerformanceMode.GENERAL_PURPOSE,
+            performance_mode=efs.PerformanceMode[efs_settings["performance_mode"].upper()],
+            throughput_mode=(
+                None
+                if efs_settings["throughput_mode"] == "bursting"
+                else efs.ThroughputMode[efs_settings["throughput_mode"].upper()]
+            ),
+            provisioned_throughput_per_second=(
+                Size.mebibytes(efs_settings["provisioned_mibps"])
+                if "provisioned_mibps" in efs_settings
+                else None
+            ),
+            vpc_subnets=(
+                ec2.SubnetSelection(subnets=[one_zone_subnet]) if one_zone_subnet else None
+            ),
             removal_policy=RemovalPolicy.DESTROY,
         )
 
+        # The EFS L2 in this CDK version has no One Zone option
+        if one_zone_subnet:
+            self.hpcefs.node.default_child.add_property_override(
+                "AvailabilityZoneName", one_zone_subnet.availability_zone
+            )
+
         CfnOutput(self, "EFSFileSystemId", value=self.hpcefs.file_system_id)
 
         ssm.StringParameter(
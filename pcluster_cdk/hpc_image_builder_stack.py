@@ -0,0 +1,131 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from constructs import Construct
+from aws_cdk import (
+    Stack,
+    CfnOutput,
+    aws_ec2 as ec2,
+    aws_iam as iam,
+    aws_imagebuilder as imagebuilder,
+)
+
+from pcluster_cdk.images import component_document, content_version, images_config
+
+
+class HpcImageBuilderStack(Stack):
+    def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
+        super().__init__(scope, id, **kwargs)
+
+        pcluster_version = config["pcluster"]["version"]
+
+        self.hpcimage_sg = ec2.SecurityGroup(
+            self,
+            "HPC_SG_IMAGE_BUILDER",
+            vpc=vpc,
+            allow_all_outbound=True,
+        )
+
+        self.hpcimage_role = iam.Role(
+            self,
+            "HPC_IMAGE_BUILDER_ROLE",
+            assumed_by=iam.ServicePrincipal("ec2.amazonaws.com"),
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name("AmazonSSMManagedInstanceCore"),
+                iam.ManagedPolicy.from_aws_managed_policy_name(
+                    "EC2InstanceProfileForImageBuilder"
+                ),
+            ],
+        )
+
+        self.hpcimage_profile = iam.CfnInstanceProfile(
+            self,
+            "HPC_IMAGE_BUILDER_PROFILE",
+            roles=[self.hpcimage_role.role_name],
+        )
+
+        self.images = {}
+        for name, image in images_config(config).items():
+            # Customise the ParallelCluster AMI so nodes skip the installs at boot
+            parent_image = ec2.MachineImage.lookup(
+                name=f"aws-parallelcluster-{pcluster_version}-amzn2-hvm-{image['architecture']}*",
+                owners=["amazon"],
+            ).get_image(self).image_id
+
+            components = []
+            for component in image["components"]:
+                document = component_document(component)
+                components.append(
+                    imagebuilder.CfnComponent(
+                        self,
+                        f"HPC_IMAGE_COMPONENT_{name}_{component['name']}",
+                        name=f"{config['label']}-{name}-{component['name']}",
+                        platform="Linux",
+                        version=content_version(document),
+                        data=document,
+                    )
+                )
+
+            recipe = imagebuilder.CfnImageRecipe(
+                self,
+                f"HPC_IMAGE_RECIPE_{name}",
+                name=f"{config['label']}-{name}",
+                version=content_version(
+                    parent_image,
+                    str(image["root_volume_size"]),
+                    *(component_document(component) for component in image["components"]),
+                ),
+                parent_image=parent_image,
+                components=[
+                    imagebuilder.CfnImageRecipe.ComponentConfigurationProperty(
+                        component_arn=component.attr_arn
+                    )
+                    for component in components
+                ],
+                block_device_mappings=[
+                    imagebuilder.CfnImageRecipe.InstanceBlockDeviceMappingProperty(
+                        device_name="/dev/xvda",
+                        ebs=imagebuilder.CfnImageRecipe.EbsInstanceBlockDeviceSpecificationProperty(
+                            encrypted=True,
+                            volume_size=image["root_volume_size"],
+                            volume_type="gp3",
+                            delete_on_termination=True,
+                        ),
+                    )
+                ],
+            )
+
+            infrastructure = imagebuilder.CfnInfrastructureConfiguration(
+                self,
+                f"HPC_IMAGE_INFRASTRUCTURE_{name}",
+                name=f"{config['label']}-{name}",
+                instance_profile_name=self.hpcimage_profile.ref,
+                instance_types=[image["instance_type"]],
+                subnet_id=vpc.private_subnets[0].subnet_id,
+                security_group_ids=[self.hpcimage_sg.security_group_id],
+                terminate_instance_on_failure=True,
+            )
+
+            # The pipeline rebuilds on demand, the image provides the AMI for this deployment
+            imagebuilder.CfnImagePipeline(
+                self,
+                f"HPC_IMAGE_PIPELINE_{name}",
+                name=f"{config['label']}-{name}",
+                image_recipe_arn=recipe.attr_arn,
+                infrastructure_configuration_arn=infrastructure.attr_arn,
+                image_tests_configuration=imagebuilder.CfnImagePipeline.ImageTestsConfigurationProperty(
+                    image_tests_enabled=False
+                ),
+            )
+
+            self.images[name] = imagebuilder.CfnImage(
+                self,
+                f"HPC_IMAGE_{name}",
+                image_recipe_arn=recipe.attr_arn,
+                infrastructure_configuration_arn=infrastructure.attr_arn,
+                image_tests_configuration=imagebuilder.CfnImage.ImageTestsConfigurationProperty(
+                    image_tests_enabled=False
+                ),
+            )
+
+            CfnOutput(self, f"ImageId{name}", value=self.images[name].attr_image_id)
@@ -12,12 +12,17 @@ from aws_cdk import (
     RemovalPolicy,
 )
 
+from pcluster_cdk.lustre_data import data_repositories
+from pcluster_cdk.lustre_profiles import lustre_profile, validate_lustre_profile
+from pcluster_cdk.placement import compute_azs, placement_config, storage_subnet
+
 
 class HpcLustreStack(Stack):
     def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
         super().__init__(scope, id, **kwargs)
 
-        lustre_subnet = vpc.private_subnets[0]
+        lustre_subnet = storage_subnet(vpc, config)
+        placement = placement_config(config)
 
         self.hpclustre_sg = ec2.SecurityGroup(
             self,
@@ -37,23 +42,6 @@ class HpcLustreStack(Stack):
             "Allows Lustre traffic between FSx for Lustre file servers",
         )
 
-        lustre_config = fsx.LustreConfiguration(
-            deployment_type=fsx.LustreDeploymentType.PERSISTENT_2,
-            data_compression_type=fsx.LustreDataCompressionType.LZ4,
-            per_unit_storage_throughput=config["lustre"]["throughput"],
-        )
-
-        self.hpclustre = fsx.LustreFileSystem(
-            self,
-            "HPC_LUSTRE",
-            vpc=vpc,
-            security_group=self.hpclustre_sg,
-            vpc_subnet=lustre_subnet,
-            storage_capacity_gib=config["lustre"]["capacity"],
-            lustre_configuration=lustre_config,
-            removal_policy=RemovalPolicy.DESTROY,
-        )
-
         self.hpcbucket = s3.Bucket(
             self,
             "HPC_S3B",
@@ -64,24 +52,91 @@ class HpcLustreStack(Stack):
             enforce_ssl=True,
         )
 
-        self.hpcdra = fsx.CfnDataRepositoryAssociation(
-            self,
-            "HPC_DRA",
-            data_repository_path=f"s3://{self.hpcbucket.bucket_name}/lustre/",
-            file_system_id=self.hpclustre.file_system_id,
-            file_system_path="/",
-            batch_import_meta_data_on_create=True,
-            imported_file_chunk_size=1024,
-            s3=fsx.CfnDataRepositoryAssociation.S3Property(
-                auto_export_policy=fsx.CfnDataRepositoryAssociation.AutoExportPolicyProperty(
-                    events=["NEW", "CHANGED", "DELETED"],
-                ),
-                auto_import_policy=fsx.CfnDataRepositoryAssociation.AutoImportPolicyProperty(
-                    events=["NEW", "CHANGED", "DELETED"],
-                ),
-            ),
+        self.lustre_profile = lustre_profile(config["lustre"])
+        self.data_repositories = data_repositories(config["lustre"])
+
+        # Data repository associations are only available on PERSISTENT_2,
+        # other deployment types link one bucket through import/export paths
+        data_repository_path = None
+        if self.lustre_profile["deployment_type"] != "PERSISTENT_2":
+            if len(self.data_repositories) > 1 or any(
+                repository["file_system_path"] != "/"
+                for repository in self.data_repositories
+            ):
+                raise ValueError(
+                    f"Lustre profile '{self.lustre_profile['name']}' can only link one "
+                    "data repository at file_system_path '/'"
+                )
+            if self.data_repositories:
+                repository = self.data_repositories[0]
+                data_repository_path = self.data_repository_path(repository)
+                self.lustre_profile["imported_file_chunk_size"] = repository.get(
+                    "imported_file_chunk_size",
+                    self.lustre_profile["imported_file_chunk_size"],
+                )
+
+        self.hpclustre = self.lustre_file_system(
+            "HPC_LUSTRE",
+            vpc,
+            lustre_subnet,
+            config["lustre"]["capacity"],
+            self.lustre_profile,
+            data_repository_path,
         )
 
+        # One scratch filesystem per compute AZ, mounted only by that AZ's queues
+        self.hpclustre_scratch = {}
+        if placement["policy"] == "replicate":
+            scratch_profile = lustre_profile({"profile": "scratch-burst"})
+            for az in compute_azs(config):
+                self.hpclustre_scratch[az] = self.lustre_file_system(
+                    f"HPC_LUSTRE_SCRATCH_{az}",
+                    vpc,
+                    vpc.private_subnets[az],
+                    placement["scratch"]["capacity"],
+                    scratch_profile,
+                )
+                CfnOutput(
+                    self,
+                    f"LustreScratchFileSystemId{az}",
+                    value=self.hpclustre_scratch[az].file_system_id,
+                )
+
+        self.hpcdras = []
+        if self.lustre_profile["deployment_type"] == "PERSISTENT_2":
+            for index, repository in enumerate(self.data_repositories):
+                self.hpcdras.append(
+                    fsx.CfnDataRepositoryAssociation(
+                        self,
+                        "HPC_DRA" if index == 0 else f"HPC_DRA_{index}",
+                        data_repository_path=self.data_repository_path(repository),
+                        file_system_id=self.hpclustre.file_system_id,
+                        file_system_path=repository["file_system_path"],
+                        batch_import_meta_data_on_create=repository["batch_import"],
+                        imported_file_chunk_size=repository.get(
+                            "imported_file_chunk_size",
+                            self.lustre_profile["imported_file_chunk_size"],
+                        ),
+                        s3=fsx.CfnDataRepositoryAssociation.S3Property(
+                            auto_export_policy=(
+                                fsx.CfnDataRepositoryAssociation.AutoExportPolicyProperty(
+                                    events=repository["export_events"],
+                                )
+                                if repository["export_events"]
+                                else None
+                            ),
+                            auto_import_policy=(
+                                fsx.CfnDataRepositoryAssociation.AutoImportPolicyProperty(
+                                    events=repository["import_events"],
+                                )
+                                if repository["import_events"]
+                                else None
+                            ),
+                        ),
+                    )
+                )
+            self.hpcdra = self.hpcdras[0] if self.hpcdras else None
+
         CfnOutput(self, "LustreFileSystemId", value=self.hpclustre.file_system_id)
 
         ssm.StringParameter(
@@ -97,3 +152,63 @@ class HpcLustreStack(Stack):
             parameter_name=config["parameter_root"] + "/lustre_dns_name",
             string_value=self.hpclustre.dns_name,
         )
+
+    def data_repository_path(self, repository):
+        bucket_name = repository.get("bucket", self.hpcbucket.bucket_name)
+        return f"s3://{bucket_name}/{repository['prefix']}"
+
+    def lustre_file_system(
+        self, id, vpc, subnet, capacity, profile, data_repository_path=None
+    ):
+        validate_lustre_profile(profile, capacity)
+
+        deployment_type = fsx.LustreDeploymentType[profile["deployment_type"]]
+        hdd = profile["storage_type"] == "HDD"
+        linked = (
+            data_repository_path is not None
+            and profile["deployment_type"] != "PERSISTENT_2"
+        )
+
+        lustre_config = fsx.LustreConfiguration(
+            deployment_type=deployment_type,
+            data_compression_type=fsx.LustreDataCompressionType[profile["compression"]],
+            per_unit_storage_throughput=None if hdd else profile["throughput"],
+            import_path=data_repository_path if linked else None,
+            export_path=data_repository_path if linked else None,
+            auto_import_policy=(
+                fsx.LustreAutoImportPolicy.NEW_CHANGED_DELETED if linked else None
+            ),
+            imported_file_chunk_size_mib=(
+                profile["imported_file_chunk_size"] if linked else None
+            ),
+        )
+
+        file_system = fsx.LustreFileSystem(
+            self,
+            id,
+            vpc=vpc,
+            security_group=self.hpclustre_sg,
+            vpc_subnet=subnet,
+            # The L2 only knows SSD capacity rules, HDD sizes were checked above
+            storage_capacity_gib=1200 if hdd else capacity,
+            lustre_configuration=lustre_config,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # Settings the LustreFileSystem L2 does not expose in this CDK version
+        cfn_file_system = file_system.node.default_child
+        if hdd:
+            cfn_file_system.add_property_override("StorageType", "HDD")
+            cfn_file_system.add_property_override("StorageCapacity", capacity)
+            cfn_file_system.add_property_override(
+                "LustreConfiguration.PerUnitStorageThroughput", profile["throughput"]
+            )
+            cfn_file_system.add_property_override(
+                "LustreConfiguration.DriveCacheType", profile.get("drive_cache", "NONE")
+            )
+        if "metadata" in profile:
+            cfn_file_system.add_property_override(
+                "LustreConfiguration.MetadataConfiguration", profile["metadata"]
+            )
+
+        return file_system
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT-0
 
 from constructs import Construct
-from aws_cdk import Stack, aws_ec2 as ec2, CfnOutput
+from aws_cdk import Stack, Annotations, aws_ec2 as ec2, CfnOutput
+
+from pcluster_cdk.vpc_endpoints import endpoints_config, nat_dependent_services
 
 
 class HpcNetworkStack(Stack):
@@ -35,6 +37,47 @@ class HpcNetworkStack(Stack):
             nat_gateways=gateways,
         )
 
+        endpoints = endpoints_config(config["vpc"])
+        private_subnets = ec2.SubnetSelection(
+            subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+        )
+
+        for service in endpoints["gateway"]:
+            self.hpcvpc.add_gateway_endpoint(
+                f"HPC_ENDPOINT_{service}",
+                service=ec2.GatewayVpcEndpointAwsService(service),
+                subnets=[private_subnets],
+            )
+
+        if endpoints["interface"]:
+            self.hpcendpoints_sg = ec2.SecurityGroup(
+                self,
+                "HPC_SG_ENDPOINTS",
+                vpc=self.hpcvpc,
+                allow_all_outbound=True,
+            )
+            self.hpcendpoints_sg.add_ingress_rule(
+                ec2.Peer.ipv4(config["vpc"]["cidr"]),
+                ec2.Port.tcp(443),
+                "Allow HTTPS from the VPC to interface endpoints",
+            )
+
+        for service in endpoints["interface"]:
+            self.hpcvpc.add_interface_endpoint(
+                f"HPC_ENDPOINT_{service}",
+                service=ec2.InterfaceVpcEndpointAwsService(service),
+                subnets=private_subnets,
+                security_groups=[self.hpcendpoints_sg],
+                private_dns_enabled=True,
+                open=False,
+            )
+
+        for service, purpose in nat_dependent_services(endpoints).items():
+            Annotations.of(self).add_info(
+                f"Compute node traffic to {service} ({purpose}) goes through "
+                f"{gateways} NAT gateway(s)"
+            )
+
         for id, subnet in enumerate(self.hpcvpc.public_subnets):
             label = f"PUBLIC subnet {id}"
             CfnOutput(self, label, value=subnet.subnet_id)
@@ -0,0 +1,80 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from constructs import Construct
+from aws_cdk import (
+    Stack,
+    aws_ec2 as ec2,
+    aws_rds as rds,
+    aws_secretsmanager as secretsmanager,
+    CfnOutput,
+    Duration,
+)
+
+from pcluster_cdk.slurm_db import slurm_db_config
+
+
+class HpcSlurmDbStack(Stack):
+    def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
+        super().__init__(scope, id, **kwargs)
+
+        slurm_db = slurm_db_config(config)
+
+        # Attached to the head node, the only client slurmdbd runs on
+        self.hpcslurmdb_client_sg = ec2.SecurityGroup(
+            self,
+            "HPC_SG_SLURMDB_CLIENT",
+            vpc=vpc,
+            allow_all_outbound=True,
+        )
+
+        self.hpcslurmdb_sg = ec2.SecurityGroup(
+            self,
+            "HPC_SG_SLURMDB",
+            vpc=vpc,
+            allow_all_outbound=False,
+        )
+
+        self.hpcslurmdb_sg.add_ingress_rule(
+            self.hpcslurmdb_client_sg,
+            ec2.Port.tcp(3306),
+            "Allow MySQL connection from the head node",
+        )
+
+        # ParallelCluster expects the bare password, not a JSON secret
+        self.hpcslurmdb_secret = secretsmanager.Secret(
+            self,
+            "HPC_SLURMDB_PASSWORD",
+            generate_secret_string=secretsmanager.SecretStringGenerator(
+                exclude_punctuation=True,
+                password_length=32,
+            ),
+        )
+
+        self.hpcslurmdb = rds.DatabaseCluster(
+            self,
+            "HPC_SLURMDB",
+            engine=rds.DatabaseClusterEngine.aurora_mysql(
+                version=rds.AuroraMysqlEngineVersion.VER_3_04_0
+            ),
+            credentials=rds.Credentials.from_password(
+                slurm_db["user_name"], self.hpcslurmdb_secret.secret_value
+            ),
+            writer=rds.ClusterInstance.serverless_v2("HPC_SLURMDB_WRITER"),
+            serverless_v2_min_capacity=slurm_db["min_capacity"],
+            serverless_v2_max_capacity=slurm_db["max_capacity"],
+            vpc=vpc,
+            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
+            security_groups=[self.hpcslurmdb_sg],
+            storage_encrypted=True,
+            backup=rds.BackupProps(retention=Duration.days(slurm_db["backup_retention_days"])),
+        )
+
+        self.hpcslurmdb_settings = {
+            # Default MySQL port, so the host alone is a complete URI
+            "Uri": self.hpcslurmdb.cluster_endpoint.hostname,
+            "UserName": slurm_db["user_name"],
+            "PasswordSecretArn": self.hpcslurmdb_secret.secret_arn,
+        }
+
+        CfnOutput(self, "SlurmDbEndpoint", value=self.hpcslurmdb_settings["Uri"])
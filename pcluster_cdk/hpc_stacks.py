@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from pcluster_cdk.clusters import cluster_configs, cluster_stack_id
+from pcluster_cdk.hpc_capacity_reservation_stack import HpcCapacityReservationStack
+from pcluster_cdk.hpc_cluster_provider_stack import HpcClusterProviderStack
+from pcluster_cdk.hpc_cluster_stack import HpcClusterStack
+from pcluster_cdk.hpc_efs_stack import HpcEfsStack
+from pcluster_cdk.hpc_image_builder_stack import HpcImageBuilderStack
+from pcluster_cdk.hpc_keypair_stack import HpcKeypairStack
+from pcluster_cdk.hpc_lustre_stack import HpcLustreStack
+from pcluster_cdk.hpc_network_stack import HpcNetworkStack
+from pcluster_cdk.hpc_slurm_db_stack import HpcSlurmDbStack
+from pcluster_cdk.hpc_zfs_stack import HpcZfsStack
+from pcluster_cdk.storage_backends import created_backends
+from pcluster_cdk.synth_profile import SynthProfiler
+
+
+def build_hpc_stacks(app, config, env, profiler=None):
+    """Build every stack of a deployment into app, keyed by stack id.
+
+    Shared stacks are only built when the config needs them; every cluster
+    shares the network, storage, image, database and provider stacks.
+    """
+    profiler = profiler or SynthProfiler(False)
+    stacks = {}
+
+    with profiler.measure("HpcKeypairs"):
+        stacks["HpcKeypairs"] = HpcKeypairStack(app, "HpcKeypairs", config=config, env=env)
+
+    with profiler.measure("HpcNetwork"):
+        hpc_network = HpcNetworkStack(app, "HpcNetwork", config=config, env=env)
+    stacks["HpcNetwork"] = hpc_network
+
+    # Only backends the config creates get a stack, existing ones are read from config
+    storage_backends = created_backends(config)
+    shared_storage = {}
+    lustre_scratch = None
+    zfs_volumes = []
+
+    if "efs" in storage_backends:
+        with profiler.measure("HpcEfsStack"):
+            hpc_efs = HpcEfsStack(
+                scope=app, id="HpcEfsStack", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcEfsStack"] = hpc_efs
+        shared_storage["efs"] = {
+            "id": hpc_efs.hpcefs.file_system_id,
+            "security_group": hpc_efs.hpcefs_sg.security_group_id,
+        }
+
+    if "lustre" in storage_backends:
+        with profiler.measure("HpcLustreStack"):
+            hpc_lustre = HpcLustreStack(
+                scope=app, id="HpcLustreStack", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcLustreStack"] = hpc_lustre
+        shared_storage["lustre"] = {
+            "id": hpc_lustre.hpclustre.file_system_id,
+            "security_group": hpc_lustre.hpclustre_sg.security_group_id,
+        }
+        lustre_scratch = hpc_lustre.hpclustre_scratch
+
+    if "zfs" in storage_backends:
+        with profiler.measure("HpcZfsStack"):
+            hpc_zfs = HpcZfsStack(
+                scope=app, id="HpcZfsStack", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcZfsStack"] = hpc_zfs
+        shared_storage["zfs"] = {
+            "id": hpc_zfs.hpczfs.attr_root_volume_id,
+            "security_group": hpc_zfs.hpczfs_sg.security_group_id,
+        }
+        zfs_volumes = hpc_zfs.hpczfs_volumes
+
+    capacity_reservations = {}
+    if any(
+        reservation.get("create")
+        for reservation in config.get("capacity_reservations", {}).values()
+    ):
+        with profiler.measure("HpcCapacityReservations"):
+            hpc_capacity_reservations = HpcCapacityReservationStack(
+                app, "HpcCapacityReservations", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcCapacityReservations"] = hpc_capacity_reservations
+        capacity_reservations = hpc_capacity_reservations.capacity_reservations
+
+    with profiler.measure("HpcClusterProvider"):
+        hpc_cluster_provider = HpcClusterProviderStack(
+            app, "HpcClusterProvider", config=config, env=env
+        )
+    stacks["HpcClusterProvider"] = hpc_cluster_provider
+
+    images = {}
+    if config.get("images"):
+        with profiler.measure("HpcImageBuilder"):
+            hpc_image_builder = HpcImageBuilderStack(
+                app, "HpcImageBuilder", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcImageBuilder"] = hpc_image_builder
+        images = {
+            name: image.attr_image_id for name, image in hpc_image_builder.images.items()
+        }
+
+    slurm_db = None
+    if "slurm_db" in config:
+        with profiler.measure("HpcSlurmDb"):
+            hpc_slurm_db = HpcSlurmDbStack(
+                app, "HpcSlurmDb", vpc=hpc_network.hpcvpc, config=config, env=env
+            )
+        stacks["HpcSlurmDb"] = hpc_slurm_db
+        slurm_db = {
+            "settings": hpc_slurm_db.hpcslurmdb_settings,
+            "security_group": hpc_slurm_db.hpcslurmdb_client_sg.security_group_id,
+        }
+
+    for cluster_config in cluster_configs(config):
+        cluster_stack_name = cluster_stack_id(config, cluster_config)
+        with profiler.measure(cluster_stack_name):
+            stacks[cluster_stack_name] = HpcClusterStack(
+                app,
+                cluster_stack_name,
+                cluster_provider=hpc_cluster_provider.cluster_provider,
+                vpc=hpc_network.hpcvpc,
+                config=cluster_config,
+                shared_storage=shared_storage,
+                lustre_scratch=lustre_scratch,
+                zfs_volumes=zfs_volumes,
+                capacity_reservations=capacity_reservations,
+                images=images,
+                slurm_db=slurm_db,
+                env=env,
+            )
+        # The cluster names its key pair, nothing references the stack's resources
+        stacks[cluster_stack_name].add_dependency(stacks["HpcKeypairs"])
+    return stacks
@@ -10,12 +10,15 @@ from aws_cdk import (
     CfnOutput,
 )
 
+from pcluster_cdk.placement import storage_subnet
+from pcluster_cdk.zfs_volumes import DEFAULT_NFS_OPTIONS, zfs_volumes
+
 
 class HpcZfsStack(Stack):
     def __init__(self, scope: Construct, id: str, vpc, config: dict, **kwargs) -> None:
         super().__init__(scope, id, **kwargs)
 
-        zfs_subnet = vpc.private_subnets[0]
+        zfs_subnet = storage_subnet(vpc, config)
 
         self.hpczfs_sg = ec2.SecurityGroup(
             self,
@@ -67,7 +70,7 @@ class HpcZfsStack(Stack):
                         client_configurations=[
                             fsx.CfnFileSystem.ClientConfigurationsProperty(
                                 clients=vpc.vpc_cidr_block,
-                                options=["rw", "crossmnt", "async", "no_root_squash"],
+                                options=DEFAULT_NFS_OPTIONS,
                             )
                         ]
                     )
@@ -89,6 +92,48 @@ class HpcZfsStack(Stack):
 
         CfnOutput(self, "ZFSSharedVolumeId", value=self.hpczfs.attr_root_volume_id)
 
+        # Child volumes of the root volume, each mounted separately by the cluster
+        self.hpczfs_volumes = []
+        for volume in zfs_volumes(config["zfs"]):
+            hpczfs_volume = fsx.CfnVolume(
+                self,
+                f"HPC_ZFS_VOLUME_{volume['name']}",
+                name=volume["name"],
+                volume_type="OPENZFS",
+                open_zfs_configuration=fsx.CfnVolume.OpenZFSConfigurationProperty(
+                    parent_volume_id=self.hpczfs.attr_root_volume_id,
+                    copy_tags_to_snapshots=True,
+                    data_compression_type=volume["compression"],
+                    record_size_kib=volume["record_size"],
+                    storage_capacity_quota_gib=volume.get("quota_gib"),
+                    storage_capacity_reservation_gib=volume.get("reservation_gib"),
+                    nfs_exports=[
+                        fsx.CfnVolume.NfsExportsProperty(
+                            client_configurations=[
+                                fsx.CfnVolume.ClientConfigurationsProperty(
+                                    clients=vpc.vpc_cidr_block,
+                                    options=volume["nfs_options"],
+                                )
+                            ]
+                        )
+                    ],
+                    options=["DELETE_CHILD_VOLUMES_AND_SNAPSHOTS"],
+                    read_only=False,
+                ),
+            )
+            self.hpczfs_volumes.append(
+                {
+                    "name": volume["name"],
+                    "mount_dir": volume["mount_dir"],
+                    "volume_id": hpczfs_volume.attr_volume_id,
+                }
+            )
+            CfnOutput(
+                self,
+                f"ZFSVolumeId{volume['name']}",
+                value=hpczfs_volume.attr_volume_id,
+            )
+
         ssm.StringParameter(
             self,
             "HPC_ZFS_DNS_NAME_PARAMETER",
@@ -0,0 +1,90 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import hashlib
+import json
+import re
+
+from pcluster_cdk.instance_types import instance_spec
+
+DEFAULT_IMAGE_CONFIG = {
+    "instance_type": "c6i.2xlarge",
+    "root_volume_size": 50,
+    "components": [],
+}
+
+# Exactly one of these keys describes what a component installs
+COMPONENT_KINDS = ("packages", "lustre_client", "efa_installer", "commands")
+
+IMAGE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9\-]{0,31}$")
+
+
+def images_config(config):
+    """Validated image definitions from config["images"], by name."""
+    images = {}
+    for name, image in config.get("images", {}).items():
+        if not IMAGE_NAME_PATTERN.match(name):
+            raise ValueError(f"Image name '{name}' must be lowercase alphanumeric or '-'")
+        image = dict(DEFAULT_IMAGE_CONFIG, **image)
+        image["architecture"] = instance_spec(image["instance_type"])["architecture"]
+        seen = set()
+        for component in image["components"]:
+            kinds = [kind for kind in COMPONENT_KINDS if kind in component]
+            if len(kinds) != 1:
+                raise ValueError(
+                    f"Image '{name}' component '{component.get('name')}' must set exactly one of {COMPONENT_KINDS}"
+                )
+            if component["name"] in seen:
+                raise ValueError(f"Image '{name}' declares component '{component['name']}' twice")
+            seen.add(component["name"])
+        images[name] = image
+    return images
+
+
+def component_commands(component):
+    if "packages" in component:
+        return [f"yum install -y {' '.join(component['packages'])}"]
+    if "lustre_client" in component:
+        # true installs the current client topic, a version string such as "2.10" pins it
+        version = component["lustre_client"]
+        topic = "lustre" if version is True else f"lustre{version}"
+        return [f"amazon-linux-extras install -y {topic}"]
+    if "efa_installer" in component:
+        installer = f"aws-efa-installer-{component['efa_installer']}.tar.gz"
+        return [
+            "cd /tmp",
+            f"curl -sSfO https://efa-installer.amazonaws.com/{installer}",
+            f"tar -xf {installer}",
+            "cd aws-efa-installer && ./efa_installer.sh -y",
+            "rm -rf /tmp/aws-efa-installer*",
+        ]
+    return component["commands"]
+
+
+def component_document(component):
+    """Image Builder component document, JSON is valid YAML."""
+    return json.dumps(
+        {
+            "name": component["name"],
+            "schemaVersion": 1.0,
+            "phases": [
+                {
+                    "name": "build",
+                    "steps": [
+                        {
+                            "name": "Install",
+                            "action": "ExecuteBash",
+                            "inputs": {"commands": component_commands(component)},
+                        }
+                    ],
+                }
+            ],
+        },
+        sort_keys=True,
+    )
+
+
+def content_version(*parts):
+    """Semantic version derived from content, Image Builder versions are immutable."""
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return f"1.0.{int(digest[:6], 16)}"
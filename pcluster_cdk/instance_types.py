@@ -0,0 +1,31 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import functools
+import json
+import os
+
+# Bundled so synth never needs EC2 API access, refresh with
+# tools/refresh_instance_catalog.py
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "data", "instance_types.json")
+
+
+@functools.lru_cache(maxsize=None)
+def instance_catalog():
+    """Instance type specs keyed by instance type name, loaded once per process."""
+    with open(CATALOG_PATH, "r") as catalog_json:
+        return json.load(catalog_json)["instance_types"]
+
+
+def instance_spec(instance_type):
+    try:
+        return instance_catalog()[instance_type]
+    except KeyError:
+        raise ValueError(
+            f"Instance type '{instance_type}' is not in the bundled catalog, "
+            "add it with tools/refresh_instance_catalog.py"
+        ) from None
+
+
+def supports_efa(instance_type):
+    return instance_spec(instance_type)["efa"]
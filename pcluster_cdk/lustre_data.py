@@ -0,0 +1,108 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import posixpath
+
+DATA_REPOSITORY_EVENTS = ("NEW", "CHANGED", "DELETED")
+MAX_DATA_REPOSITORIES = 8
+
+DEFAULT_DATA_REPOSITORY = {
+    "file_system_path": "/",
+    "prefix": "lustre/",
+    "batch_import": True,
+    "import_events": list(DATA_REPOSITORY_EVENTS),
+    "export_events": list(DATA_REPOSITORY_EVENTS),
+}
+
+DEFAULT_PRELOAD_CONFIG = {"paths": [], "parallelism": 16, "stub": False, "timeout_minutes": 180}
+
+# HeadNodeBootstrapTimeout is a CloudFormation wait condition, capped at 12 hours
+MAX_PRELOAD_TIMEOUT_MINUTES = 720
+
+
+def validate_path(path, label):
+    if not path.startswith("/") or posixpath.normpath(path) != path:
+        raise ValueError(f"{label} '{path}' must be an absolute, normalised filesystem path")
+
+
+def path_contains(parent, path):
+    return parent == "/" or path == parent or path.startswith(parent + "/")
+
+
+def paths_overlap(a, b):
+    return path_contains(a, b) or path_contains(b, a)
+
+
+def data_repositories(lustre_config):
+    """Return the validated data repository associations for the Lustre filesystem."""
+    repositories = [
+        dict(DEFAULT_DATA_REPOSITORY, **repository)
+        for repository in lustre_config.get("data_repositories", [{}])
+    ]
+    if len(repositories) > MAX_DATA_REPOSITORIES:
+        raise ValueError(
+            f"A Lustre filesystem supports at most {MAX_DATA_REPOSITORIES} data repository associations"
+        )
+
+    for index, repository in enumerate(repositories):
+        path = repository["file_system_path"]
+        validate_path(path, "Data repository file_system_path")
+        if repository["prefix"] and not repository["prefix"].endswith("/"):
+            repository["prefix"] += "/"
+        if not 1 <= repository.get("imported_file_chunk_size", 1) <= 512000:
+            raise ValueError(
+                f"Data repository '{path}' imported_file_chunk_size must be 1-512000 MiB"
+            )
+        for key in ("import_events", "export_events"):
+            unknown = set(repository[key]) - set(DATA_REPOSITORY_EVENTS)
+            if unknown:
+                raise ValueError(
+                    f"Data repository '{path}' has unknown {key} {sorted(unknown)}, "
+                    f"expected a subset of {DATA_REPOSITORY_EVENTS}"
+                )
+        for other in repositories[:index]:
+            if paths_overlap(path, other["file_system_path"]):
+                raise ValueError(
+                    f"Data repository paths '{other['file_system_path']}' and '{path}' overlap"
+                )
+            if other.get("bucket") == repository.get("bucket") and paths_overlap(
+                "/" + other["prefix"].rstrip("/"), "/" + repository["prefix"].rstrip("/")
+            ):
+                raise ValueError(
+                    f"Data repositories for '{other['file_system_path']}' and '{path}' "
+                    f"use overlapping S3 prefixes"
+                )
+
+    return repositories
+
+
+def preload_config(lustre_config):
+    preload = dict(DEFAULT_PRELOAD_CONFIG, **lustre_config.get("preload", {}))
+    repositories = data_repositories(lustre_config)
+    for path in preload["paths"]:
+        validate_path(path, "Lustre preload path")
+        if not any(
+            path_contains(repository["file_system_path"], path)
+            for repository in repositories
+            if repository["import_events"] or repository["batch_import"]
+        ):
+            raise ValueError(
+                f"Lustre preload path '{path}' is not under an importing data repository"
+            )
+    if preload["parallelism"] < 1:
+        raise ValueError("Lustre preload parallelism must be at least 1")
+    if not 1 <= preload["timeout_minutes"] <= MAX_PRELOAD_TIMEOUT_MINUTES:
+        raise ValueError(
+            f"Lustre preload timeout_minutes must be 1-{MAX_PRELOAD_TIMEOUT_MINUTES}"
+        )
+    return preload
+
+
+def preload_args(preload, mount_dir):
+    """Arguments for the preload_lustre.sh OnNodeConfigured action."""
+    return [
+        mount_dir,
+        str(preload["parallelism"]),
+        "true" if preload["stub"] else "false",
+        *preload["paths"],
+    ]
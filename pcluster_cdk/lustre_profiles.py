@@ -0,0 +1,126 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+DEFAULT_LUSTRE_PROFILE = "persistent2-lz4"
+
+LUSTRE_PROFILES = {
+    "persistent2-lz4": {
+        "deployment_type": "PERSISTENT_2",
+        "storage_type": "SSD",
+        "throughput": 125,
+        "compression": "LZ4",
+        "imported_file_chunk_size": 1024,
+    },
+    "scratch-burst": {
+        "deployment_type": "SCRATCH_2",
+        "storage_type": "SSD",
+        "throughput": None,
+        "compression": "LZ4",
+        "imported_file_chunk_size": 1024,
+    },
+    "persistent-ssd-1000": {
+        "deployment_type": "PERSISTENT_2",
+        "storage_type": "SSD",
+        "throughput": 1000,
+        "compression": "LZ4",
+        "metadata": {"Mode": "AUTOMATIC"},
+        "imported_file_chunk_size": 1024,
+    },
+    "hdd-with-ssd-cache": {
+        "deployment_type": "PERSISTENT_1",
+        "storage_type": "HDD",
+        "throughput": 40,
+        "drive_cache": "READ",
+        "compression": "LZ4",
+        "imported_file_chunk_size": 1024,
+    },
+}
+
+# (deployment type, storage type, per-unit throughput MB/s/TiB)
+#   -> (capacities allowed below the increment, capacity increment in GiB)
+LUSTRE_CAPACITY_RULES = {
+    ("SCRATCH_1", "SSD", None): ((1200, 2400), 3600),
+    ("SCRATCH_2", "SSD", None): ((1200,), 2400),
+    ("PERSISTENT_1", "SSD", 50): ((1200,), 2400),
+    ("PERSISTENT_1", "SSD", 100): ((1200,), 2400),
+    ("PERSISTENT_1", "SSD", 200): ((1200,), 2400),
+    ("PERSISTENT_1", "HDD", 12): ((), 6000),
+    ("PERSISTENT_1", "HDD", 40): ((), 1800),
+    ("PERSISTENT_2", "SSD", 125): ((1200,), 2400),
+    ("PERSISTENT_2", "SSD", 250): ((1200,), 2400),
+    ("PERSISTENT_2", "SSD", 500): ((1200,), 2400),
+    ("PERSISTENT_2", "SSD", 1000): ((1200,), 2400),
+}
+
+LUSTRE_COMPRESSION_TYPES = ("NONE", "LZ4")
+LUSTRE_METADATA_IOPS = (1500, 3000, 6000) + tuple(range(12000, 192001, 12000))
+
+
+def lustre_profile(lustre_config):
+    """Resolve the named profile in lustre_config, letting explicit keys override it."""
+    name = lustre_config.get("profile", DEFAULT_LUSTRE_PROFILE)
+    if name not in LUSTRE_PROFILES:
+        raise ValueError(
+            f"Unknown Lustre profile '{name}', expected one of {sorted(LUSTRE_PROFILES)}"
+        )
+    profile = dict(LUSTRE_PROFILES[name], name=name)
+    for key in ("throughput", "compression", "drive_cache", "metadata", "imported_file_chunk_size"):
+        if key in lustre_config:
+            profile[key] = lustre_config[key]
+    return profile
+
+
+def validate_lustre_profile(profile, capacity):
+    deployment_type = profile["deployment_type"]
+    storage_type = profile["storage_type"]
+    throughput = profile["throughput"]
+    label = f"Lustre profile '{profile['name']}' ({deployment_type}/{storage_type})"
+
+    rule = LUSTRE_CAPACITY_RULES.get((deployment_type, storage_type, throughput))
+    if rule is None:
+        tiers = sorted(
+            str(t)
+            for d, s, t in LUSTRE_CAPACITY_RULES
+            if (d, s) == (deployment_type, storage_type)
+        )
+        if not tiers:
+            raise ValueError(f"{label} is not a supported combination")
+        raise ValueError(
+            f"{label} does not support throughput {throughput}, expected one of {', '.join(tiers)}"
+        )
+
+    allowed, increment = rule
+    if capacity not in allowed and (capacity <= 0 or capacity % increment):
+        sizes = ", ".join(str(size) for size in allowed + (increment,))
+        raise ValueError(
+            f"{label} at throughput {throughput} needs capacity of {sizes} "
+            f"or a multiple of {increment} GiB, got {capacity}"
+        )
+
+    if profile["compression"] not in LUSTRE_COMPRESSION_TYPES:
+        raise ValueError(
+            f"{label} compression must be one of {LUSTRE_COMPRESSION_TYPES}, got {profile['compression']}"
+        )
+
+    if "drive_cache" in profile and storage_type != "HDD":
+        raise ValueError(f"{label} can only set a drive cache on HDD storage")
+    if storage_type == "HDD" and profile.get("drive_cache", "NONE") not in ("NONE", "READ"):
+        raise ValueError(f"{label} drive cache must be NONE or READ")
+
+    metadata = profile.get("metadata")
+    if metadata is not None:
+        if deployment_type != "PERSISTENT_2":
+            raise ValueError(f"{label} can only set a metadata configuration on PERSISTENT_2")
+        if metadata.get("Mode") == "USER_PROVISIONED":
+            if metadata.get("Iops") not in LUSTRE_METADATA_IOPS:
+                raise ValueError(
+                    f"{label} metadata IOPS must be 1500, 3000, 6000 or a multiple of 12000 up to 192000"
+                )
+        elif metadata.get("Mode") != "AUTOMATIC" or "Iops" in metadata:
+            raise ValueError(
+                f"{label} metadata mode must be AUTOMATIC, or USER_PROVISIONED with Iops"
+            )
+
+    chunk_size = profile["imported_file_chunk_size"]
+    if not 1 <= chunk_size <= 512000:
+        raise ValueError(f"{label} imported_file_chunk_size must be 1-512000 MiB, got {chunk_size}")
@@ -0,0 +1,25 @@
+#!/bin/bash
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+#
+# OnNodeConfigured action: mount an FSx for Lustre filesystem on this node.
+# Usage: mount_lustre.sh <dns-name> <mount-name> <mount-dir>
+set -euo pipefail
+
+dns_name="$1"
+mount_name="$2"
+mount_dir="$3"
+
+mkdir -p "${mount_dir}"
+if mountpoint -q "${mount_dir}"; then
+    # A rerun finds the filesystem mounted, anything else would hide it
+    fstype=$(findmnt -n -o FSTYPE --mountpoint "${mount_dir}")
+    if [[ "${fstype}" != "lustre" ]]; then
+        echo "${mount_dir} already holds a ${fstype} filesystem, not mounting ${dns_name}" >&2
+        exit 1
+    fi
+else
+    mount -t lustre -o relatime,flock "${dns_name}@tcp:/${mount_name}" "${mount_dir}"
+    echo "${dns_name}@tcp:/${mount_name} ${mount_dir} lustre defaults,relatime,flock,_netdev 0 0" >> /etc/fstab
+fi
+chmod 1777 "${mount_dir}"
@@ -0,0 +1,60 @@
+#!/bin/bash
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+#
+# OnNodeConfigured action for the head node: restore the contents of
+# S3-linked files into FSx for Lustre before Slurm starts jobs, so the
+# first job to read them does not pay the S3 fetch latency.
+# Usage: preload_lustre.sh <mount-dir> <parallelism> <stub> <path>...
+# With <stub> set to "true" the files are only counted, nothing is restored.
+# SLURM_BIN overrides the Slurm commands directory, default /opt/slurm/bin.
+set -euo pipefail
+
+mount_dir="$1"
+parallelism="$2"
+stub="$3"
+shift 3
+
+slurm_bin="${SLURM_BIN:-/opt/slurm/bin}"
+scontrol="${slurm_bin}/scontrol"
+partitions=""
+if [ -x "${scontrol}" ]; then
+    partitions=$("${slurm_bin}/sinfo" --noheader --format=%R | sort -u)
+fi
+
+release_partitions() {
+    for partition in ${partitions}; do
+        "${scontrol}" update PartitionName="${partition}" State=UP
+    done
+}
+# Partitions come back up whether the preload finishes or fails
+trap release_partitions EXIT
+
+for partition in ${partitions}; do
+    "${scontrol}" update PartitionName="${partition}" State=DOWN
+done
+
+for path in "$@"; do
+    target="${mount_dir}${path}"
+    if [ "${stub}" = "true" ]; then
+        count=$(find "${target}" -type f | wc -l)
+        echo "preload stub: would restore ${count} files under ${target}"
+        continue
+    fi
+    find "${target}" -type f -print0 | xargs -0 -r -n 64 -P "${parallelism}" lfs hsm_restore
+done
+
+if [ "${stub}" != "true" ]; then
+    for path in "$@"; do
+        while true; do
+            # Captured first, grep -q would end the pipeline early under pipefail
+            actions=$(find "${mount_dir}${path}" -type f -print0 \
+                | xargs -0 -r -n 64 lfs hsm_action)
+            if ! grep -q RESTORE <<< "${actions}"; then
+                break
+            fi
+            sleep 10
+        done
+        echo "preloaded ${mount_dir}${path}"
+    done
+fi
@@ -0,0 +1,33 @@
+#!/bin/bash
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+#
+# OnNodeConfigured action for the head node: keep dynamic nodes of queues
+# powered up during scheduled windows. The windows are cron lines generated at
+# synth time and kept in an SSM parameter; the head node syncs them into
+# /etc/cron.d every 5 minutes, so changed windows apply without a cluster
+# update. At the start of a window the nodes are excluded from power saving
+# and powered up; at the end the exclusion is removed and they scale down once
+# idle for the queue's idle time.
+# Usage: warm_pool_schedule.sh <parameter-name> <region>
+# Hours are in the head node's timezone (UTC by default).
+set -euo pipefail
+
+parameter="$1"
+region="$2"
+
+sync_script="/usr/local/sbin/pcluster-warm-windows-sync"
+
+cat > "${sync_script}" <<SYNC
+#!/bin/bash
+set -euo pipefail
+export PATH=/usr/local/bin:/usr/bin:/bin
+aws ssm get-parameter --region "${region}" --name "${parameter}" \\
+    --query Parameter.Value --output text > /var/tmp/pcluster-warm-windows
+install -m 0644 /var/tmp/pcluster-warm-windows /etc/cron.d/pcluster-warm-windows
+SYNC
+chmod 0755 "${sync_script}"
+
+echo "*/5 * * * * root ${sync_script}" > /etc/cron.d/pcluster-warm-windows-sync
+chmod 0644 /etc/cron.d/pcluster-warm-windows-sync
+"${sync_script}"
@@ -0,0 +1,123 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import re
+import shlex
+
+from pcluster_cdk.lustre_data import validate_path
+
+# Config name -> lctl parameter, applied to every Lustre filesystem on the node
+LUSTRE_CLIENT_PARAMETERS = {
+    "max_rpcs_in_flight": "osc.*.max_rpcs_in_flight",
+    "max_dirty_mb": "osc.*.max_dirty_mb",
+    "mdc_max_rpcs_in_flight": "mdc.*.max_rpcs_in_flight",
+    "lru_size": "ldlm.namespaces.*.lru_size",
+    "lru_max_age": "ldlm.namespaces.*.lru_max_age",
+    "max_read_ahead_mb": "llite.*.max_read_ahead_mb",
+    "max_read_ahead_per_file_mb": "llite.*.max_read_ahead_per_file_mb",
+    "max_read_ahead_whole_mb": "llite.*.max_read_ahead_whole_mb",
+}
+
+NFS_MOUNT_OPTIONS = ("rsize", "wsize", "nconnect")
+NFS_MAX_NCONNECT = 16
+STRIPE_SIZE_PATTERN = re.compile(r"^[0-9]+[KMG]$")
+
+TUNING_HEADER = """#!/bin/bash
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+#
+# OnNodeConfigured action generated at synth time from config["tuning"].
+set -euo pipefail
+
+remount_nfs() {
+    mount_dir="$1"
+    overrides="$2"
+    # Tune the fstab entry, so the options also apply to later mounts and reboots
+    keys="^($(echo "${overrides}" | sed -E 's/=[^,]*//g; s/,/|/g'))="
+    awk -v dir="${mount_dir}" -v keys="${keys}" -v overrides="${overrides}" '
+        $1 !~ /^#/ && $2 == dir {
+            n = split($4, options, ",")
+            kept = ""
+            for (i = 1; i <= n; i++) {
+                if (options[i] !~ keys) {
+                    kept = kept options[i] ","
+                }
+            }
+            $4 = kept overrides
+            found = 1
+        }
+        { print }
+        END { exit !found }
+    ' /etc/fstab > /etc/fstab.tuning || {
+        echo "No /etc/fstab entry for ${mount_dir}" >&2
+        rm -f /etc/fstab.tuning
+        exit 1
+    }
+    cat /etc/fstab.tuning > /etc/fstab
+    rm -f /etc/fstab.tuning
+    umount "${mount_dir}"
+    mount "${mount_dir}"
+}"""
+
+
+def tuning_config(config):
+    """Validated client tuning blocks from config["tuning"]."""
+    tuning = config.get("tuning", {})
+    lustre = tuning.get("lustre", {})
+    for name in lustre.get("parameters", {}):
+        if name not in LUSTRE_CLIENT_PARAMETERS:
+            raise ValueError(
+                f"Unknown Lustre client parameter '{name}', expected one of {sorted(LUSTRE_CLIENT_PARAMETERS)}"
+            )
+    for stripe in lustre.get("stripes", []):
+        validate_path(stripe["path"], "Lustre stripe path")
+        if stripe.get("count", -1) != -1 and stripe.get("count", -1) < 1:
+            raise ValueError(f"Lustre stripe count for '{stripe['path']}' must be -1 or positive")
+        if "size" in stripe and not STRIPE_SIZE_PATTERN.match(stripe["size"]):
+            raise ValueError(
+                f"Lustre stripe size for '{stripe['path']}' must look like 1M, 4M or 1G"
+            )
+
+    for filesystem in ("efs", "zfs"):
+        for option, value in tuning.get(filesystem, {}).items():
+            if option not in NFS_MOUNT_OPTIONS:
+                raise ValueError(
+                    f"Unknown {filesystem} mount option '{option}', expected one of {NFS_MOUNT_OPTIONS}"
+                )
+            if option == "nconnect" and not 1 <= value <= NFS_MAX_NCONNECT:
+                raise ValueError(f"{filesystem} nconnect must be 1-{NFS_MAX_NCONNECT}")
+            if option != "nconnect" and (value < 4096 or value > 1048576 or value & (value - 1)):
+                raise ValueError(
+                    f"{filesystem} {option} must be a power of two between 4096 and 1048576"
+                )
+    return tuning
+
+
+def render_tuning_script(tuning, nfs_mounts, lustre_mount_dir, head_node):
+    """Render the tuning script for a node.
+
+    nfs_mounts maps each NFS mount directory to its tuning block. Stripe
+    layouts live on the shared filesystem, so only the head node sets them.
+    """
+    lines = [TUNING_HEADER]
+
+    # No Lustre client settings on clusters without a Lustre filesystem
+    lustre = tuning.get("lustre", {}) if lustre_mount_dir else {}
+    for name, value in lustre.get("parameters", {}).items():
+        lines.append(f"lctl set_param {shlex.quote(f'{LUSTRE_CLIENT_PARAMETERS[name]}={value}')}")
+
+    if head_node:
+        for stripe in lustre.get("stripes", []):
+            path = shlex.quote(lustre_mount_dir + stripe["path"])
+            layout = f"-c {stripe.get('count', -1)}"
+            if "size" in stripe:
+                layout += f" -S {stripe['size']}"
+            lines.append(f"mkdir -p {path}")
+            lines.append(f"lfs setstripe {layout} {path}")
+
+    for mount_dir, options in nfs_mounts.items():
+        if options:
+            overrides = ",".join(f"{option}={options[option]}" for option in sorted(options))
+            lines.append(f"remount_nfs {shlex.quote(mount_dir)} {overrides}")
+
+    return "\n".join(lines) + "\n"
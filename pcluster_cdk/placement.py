@@ -0,0 +1,84 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from pcluster_cdk.clusters import cluster_configs
+from pcluster_cdk.queues import DEFAULT_COMPUTE_CONFIG, expand_queue_matrix
+
+PLACEMENT_POLICIES = ("spread", "colocate", "replicate")
+
+DEFAULT_PLACEMENT_CONFIG = {
+    "policy": "spread",
+    "storage_az": 0,
+    "scratch": {"capacity": 1200, "mount_dir": "/lustre-scratch"},
+}
+
+
+def placement_config(config):
+    placement = dict(DEFAULT_PLACEMENT_CONFIG, **config.get("placement", {}))
+    if placement["policy"] not in PLACEMENT_POLICIES:
+        raise ValueError(
+            f"Unknown placement policy '{placement['policy']}', expected one of {PLACEMENT_POLICIES}"
+        )
+    placement["scratch"] = dict(
+        DEFAULT_PLACEMENT_CONFIG["scratch"], **placement.get("scratch", {})
+    )
+    return placement
+
+
+def storage_subnet(vpc, config):
+    storage_az = placement_config(config)["storage_az"]
+    if storage_az >= len(vpc.private_subnets):
+        raise ValueError(
+            f"Storage AZ index {storage_az} is out of range for {len(vpc.private_subnets)} private subnets"
+        )
+    return vpc.private_subnets[storage_az]
+
+
+def placed_compute_config(config):
+    """Return the queue matrix with AZ indexes adjusted for the placement policy."""
+    compute_config = config.get("compute", DEFAULT_COMPUTE_CONFIG)
+    placement = placement_config(config)
+    if placement["policy"] != "colocate":
+        return compute_config
+
+    storage_az = placement["storage_az"]
+    queues = []
+    generated = {}
+    for index, entry in enumerate(compute_config["queues"]):
+        entry = dict(entry, azs=[storage_az])
+        names = [name for name, _, _, _, _ in expand_queue_matrix({"queues": [entry]})]
+        for name in names:
+            if name in generated:
+                raise ValueError(
+                    f"Placement policy colocate moves compute.queues entries {generated[name]} "
+                    f"and {index} to AZ index {storage_az}, both generate queue '{name}'"
+                )
+            generated[name] = index
+        stale = sorted(set(entry.get("overrides", {})) - set(names))
+        if stale:
+            raise ValueError(
+                f"Placement policy colocate only keeps queues {', '.join(names)} of "
+                f"compute.queues entry {index}, overrides for {', '.join(stale)} match no queue"
+            )
+        queues.append(entry)
+    return dict(compute_config, queues=queues)
+
+
+def compute_azs(config):
+    """AZ indexes used by the queues of every cluster in config."""
+    return sorted(
+        {
+            az
+            for cluster_config in cluster_configs(config)
+            for _, _, _, az, _ in expand_queue_matrix(placed_compute_config(cluster_config))
+        }
+    )
+
+
+def cross_az_queues(queue_azs, storage_az):
+    """Group queue names by AZ index for queues outside the storage AZ."""
+    crossing = {}
+    for name, az in queue_azs.items():
+        if az != storage_az:
+            crossing.setdefault(az, []).append(name)
+    return crossing
@@ -0,0 +1,296 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import re
+
+from pcluster_cdk.instance_types import instance_spec, supports_efa
+from pcluster_cdk.lustre_data import validate_path
+from pcluster_cdk.zfs_volumes import RESERVED_MOUNT_DIRS
+
+# Equivalent to the six hand-written icl1-3/spr1-3 queues this replaced
+DEFAULT_COMPUTE_CONFIG = {
+    "families": {
+        "icl": {"compute_resource": "c6i", "instance_type": "c6i.32xlarge"},
+        "spr": {"compute_resource": "c7i", "instance_type": "c7i.48xlarge"},
+    },
+    "queues": [
+        {
+            "families": ["icl", "spr"],
+            "azs": [0, 1, 2],
+            "capacity_types": ["ONDEMAND"],
+            "max_count": 20,
+        },
+    ],
+}
+
+CAPACITY_TYPE_SUFFIXES = {"ONDEMAND": "", "SPOT": "spot"}
+
+# dedicated: one named cluster placement group per compute resource
+# managed: placement group created and named by ParallelCluster
+PLACEMENT_GROUP_MODES = ("dedicated", "managed", "none")
+
+ALLOCATION_STRATEGIES = ("lowest-price", "capacity-optimized")
+
+DEFAULT_EPHEMERAL_MOUNT_DIR = "/local_scratch"
+
+# Where ParallelCluster mounts the instance store when EphemeralVolume is not set
+PCLUSTER_EPHEMERAL_MOUNT_DIR = "/scratch"
+
+QUEUE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9\-]{0,24}$")
+
+
+def queue_name(family, capacity_type, az):
+    return f"{family}{CAPACITY_TYPE_SUFFIXES[capacity_type]}{az + 1}"
+
+
+def family_instance_types(spec):
+    """Ordered instance types of a family, flexible families list several."""
+    return spec.get("instance_types") or [spec["instance_type"]]
+
+
+def resource_instance_types(compute_resource):
+    if "Instances" in compute_resource:
+        return [instance["InstanceType"] for instance in compute_resource["Instances"]]
+    return [compute_resource["InstanceType"]]
+
+
+def ephemeral_scratch_gb(instance_types):
+    """Per-node NVMe instance store in GB, None unless every instance type has it."""
+    specs = [instance_spec(instance_type) for instance_type in instance_types]
+    if not all(spec["nvme"] for spec in specs):
+        return None
+    return min(spec["instance_store_gb"] for spec in specs)
+
+
+def ephemeral_mount_dir(name, option, shared_mount_dirs=()):
+    mount_dir = DEFAULT_EPHEMERAL_MOUNT_DIR if option is True else option
+    validate_path(mount_dir, f"Queue '{name}' ephemeral_scratch")
+    if mount_dir in RESERVED_MOUNT_DIRS or mount_dir in shared_mount_dirs:
+        raise ValueError(
+            f"Queue '{name}' ephemeral_scratch {mount_dir} is already used by the cluster"
+        )
+    return mount_dir
+
+
+def validate_instance_types(family, instance_types):
+    specs = [instance_spec(instance_type) for instance_type in instance_types]
+    for key, label in (
+        ("efa", "EFA support"),
+        ("architecture", "CPU architecture"),
+        ("vcpus", "vCPU count"),
+    ):
+        if len({spec[key] for spec in specs}) > 1:
+            raise ValueError(
+                f"Family '{family}' instance types {', '.join(instance_types)} differ in {label}"
+            )
+
+
+def is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def queue_option(entry, name, key, default=None):
+    """Per-queue override of a matrix entry setting."""
+    return entry.get("overrides", {}).get(name, {}).get(key, entry.get(key, default))
+
+
+def expand_queue_matrix(compute_config):
+    """Yield (name, family, capacity_type, az, entry) for every queue in the matrix."""
+    for entry in compute_config["queues"]:
+        for family in entry["families"]:
+            for capacity_type in entry.get("capacity_types", ["ONDEMAND"]):
+                if capacity_type not in CAPACITY_TYPE_SUFFIXES:
+                    raise ValueError(
+                        f"Unsupported capacity type '{capacity_type}' for family '{family}'"
+                    )
+                for az in entry["azs"]:
+                    yield queue_name(family, capacity_type, az), family, capacity_type, az, entry
+
+
+def build_slurm_queues(
+    compute_config,
+    subnet_ids,
+    compute_settings,
+    common_compute_settings,
+    security_groups,
+    efa_security_group=None,
+    placement_group=None,
+    capacity_reservation_target=None,
+    images=None,
+    shared_mount_dirs=(),
+):
+    """Build SlurmQueues from the queue matrix.
+
+    placement_group is called with (queue name, compute resource name) and
+    returns the name of the placement group for dedicated compute resources.
+    capacity_reservation_target is called with (queue name, reservation name,
+    capacity type, AZ index, instance types) and returns the
+    CapacityReservationTarget for queues that reference a reservation and
+    the placement group the reservation is in, or None. Reserved compute
+    resources use that placement group instead of their family's.
+    images maps image names to their AMI ID and architecture for queues
+    that override the cluster image. shared_mount_dirs lists the mount
+    directories of shared storage outside RESERVED_MOUNT_DIRS, such as ZFS
+    child volumes, which ephemeral scratch cannot use.
+    """
+    families = compute_config["families"]
+
+    # Built once per family and shared by every queue that uses it
+    family_settings = {}
+    efa_security_groups = security_groups + [efa_security_group]
+    for family, spec in families.items():
+        instance_types = family_instance_types(spec)
+        validate_instance_types(family, instance_types)
+        efa = spec.get("efa", True)
+        if efa and not supports_efa(instance_types[0]):
+            raise ValueError(
+                f"Family '{family}' enables EFA but {', '.join(instance_types)} does not support it"
+            )
+        mode = spec.get("placement_group", "dedicated")
+        if mode not in PLACEMENT_GROUP_MODES:
+            raise ValueError(
+                f"Family '{family}' placement_group must be one of {PLACEMENT_GROUP_MODES}"
+            )
+        if "instance_types" in spec:
+            instances = {
+                "Instances": [
+                    {"InstanceType": instance_type} for instance_type in instance_types
+                ]
+            }
+        else:
+            instances = {"InstanceType": spec["instance_type"]}
+        family_settings[family] = {
+            "Name": spec["compute_resource"],
+            **instances,
+            **common_compute_settings,
+            "Efa": {"Enabled": "true" if efa else "false"},
+        }
+        if mode == "none":
+            family_settings[family]["Networking"] = {"PlacementGroup": {"Enabled": "false"}}
+
+    queues = []
+    seen = set()
+    for name, family, capacity_type, az, entry in expand_queue_matrix(compute_config):
+        if family not in families:
+            raise ValueError(f"Queue '{name}' uses undeclared family '{family}'")
+        if not QUEUE_NAME_PATTERN.match(name):
+            raise ValueError(f"Generated queue name '{name}' is not a valid Slurm queue name")
+        if name in seen:
+            raise ValueError(f"Queue matrix generates '{name}' more than once")
+        if az >= len(subnet_ids):
+            raise ValueError(
+                f"Queue '{name}' targets AZ index {az} but only {len(subnet_ids)} private subnets exist"
+            )
+        seen.add(name)
+
+        max_count = queue_option(entry, name, "max_count")
+        if not is_count(max_count) or max_count < 1:
+            raise ValueError(f"Queue '{name}' max_count must be an integer of at least 1")
+        compute_resource = {
+            "MaxCount": str(max_count),
+            **family_settings[family],
+        }
+        reservation = queue_option(entry, name, "capacity_reservation")
+        if reservation is not None:
+            target, reservation_placement_group = capacity_reservation_target(
+                name,
+                reservation,
+                capacity_type,
+                az,
+                resource_instance_types(compute_resource),
+            )
+            compute_resource["CapacityReservationTarget"] = target
+            # Reserved instances launch in the reservation's placement group, if any
+            compute_resource["Networking"] = {
+                "PlacementGroup": (
+                    {"Enabled": "true", "Name": reservation_placement_group}
+                    if reservation_placement_group
+                    else {"Enabled": "false"}
+                )
+            }
+        elif families[family].get("placement_group", "dedicated") == "dedicated":
+            compute_resource["Networking"] = {
+                "PlacementGroup": {
+                    "Enabled": "true",
+                    "Name": placement_group(name, compute_resource["Name"]),
+                }
+            }
+        min_count = queue_option(entry, name, "min_count")
+        if min_count is not None:
+            if not is_count(min_count) or not 0 <= min_count <= max_count:
+                raise ValueError(f"Queue '{name}' min_count must be an integer between 0 and max_count")
+            compute_resource["MinCount"] = str(min_count)
+
+        queue = {
+            "Name": name,
+            "CapacityType": capacity_type,
+        }
+        allocation_strategy = queue_option(entry, name, "allocation_strategy")
+        if allocation_strategy is not None:
+            if allocation_strategy not in ALLOCATION_STRATEGIES:
+                raise ValueError(
+                    f"Queue '{name}' allocation_strategy must be one of {ALLOCATION_STRATEGIES}"
+                )
+            if allocation_strategy == "capacity-optimized" and capacity_type != "SPOT":
+                raise ValueError(
+                    f"Queue '{name}' can only use capacity-optimized allocation with SPOT"
+                )
+            queue["AllocationStrategy"] = allocation_strategy
+
+        queue_compute_settings = compute_settings
+        ephemeral_scratch = queue_option(entry, name, "ephemeral_scratch")
+        mount_dir = None
+        if ephemeral_scratch:
+            mount_dir = ephemeral_mount_dir(name, ephemeral_scratch, shared_mount_dirs)
+        elif PCLUSTER_EPHEMERAL_MOUNT_DIR in shared_mount_dirs:
+            # Keep the default instance store mount off shared storage mounted there
+            mount_dir = DEFAULT_EPHEMERAL_MOUNT_DIR
+        if mount_dir:
+            if ephemeral_scratch_gb(resource_instance_types(compute_resource)):
+                # Instance store volumes are striped and mounted here by ParallelCluster
+                queue_compute_settings = dict(
+                    compute_settings,
+                    LocalStorage=dict(
+                        compute_settings["LocalStorage"],
+                        EphemeralVolume={"MountDir": mount_dir},
+                    ),
+                )
+
+        queue.update(
+            {
+                "JobExclusiveAllocation": "true",
+                "ComputeSettings": queue_compute_settings,
+                "ComputeResources": [compute_resource],
+                "Networking": {
+                    "SubnetIds": [subnet_ids[az]],
+                    "AdditionalSecurityGroups": (
+                        efa_security_groups
+                        if compute_resource["Efa"]["Enabled"] == "true"
+                        else security_groups
+                    ),
+                },
+            }
+        )
+        image = queue_option(entry, name, "image")
+        if image is not None:
+            if image not in (images or {}):
+                raise ValueError(f"Queue '{name}' references undeclared image '{image}'")
+            architecture = instance_spec(resource_instance_types(compute_resource)[0])[
+                "architecture"
+            ]
+            if images[image]["architecture"] != architecture:
+                raise ValueError(
+                    f"Queue '{name}' runs {architecture} instances but image '{image}' "
+                    f"is built for {images[image]['architecture']}"
+                )
+            queue["Image"] = {"CustomAmi": images[image]["ami"]}
+
+        idle_timeout = queue_option(entry, name, "idle_timeout")
+        if idle_timeout is not None:
+            if idle_timeout < 1:
+                raise ValueError(f"Queue '{name}' idle_timeout must be at least 1 minute")
+            # Per-partition SuspendTime overrides the cluster-wide ScaledownIdletime
+            queue["CustomSlurmSettings"] = {"SuspendTime": str(idle_timeout * 60)}
+        queues.append(queue)
+
+    return queues
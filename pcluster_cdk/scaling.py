@@ -0,0 +1,76 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import re
+
+DEFAULT_SCALING_CONFIG = {"idle_timeout": 5}
+
+DAYS_PATTERN = re.compile(r"^[0-6](-[0-6])?(,[0-6](-[0-6])?)*$")
+
+SCONTROL = "/opt/slurm/bin/scontrol"
+
+# Standard SSM parameters hold 4 KB, advanced ones 8 KB
+MAX_WARM_WINDOWS_BYTES = 8192
+
+
+def scaling_config(config):
+    scaling = dict(DEFAULT_SCALING_CONFIG, **config.get("scaling", {}))
+    if scaling["idle_timeout"] < 1:
+        raise ValueError("scaling idle_timeout must be at least 1 minute")
+    return scaling
+
+
+def covered_days(days):
+    """Weekdays covered by a cron day-of-week field such as '1-5' or '0,6'."""
+    if not DAYS_PATTERN.match(days):
+        raise ValueError(f"Warm window days '{days}' must be cron day-of-week numbers 0-6")
+    covered = set()
+    for part in days.split(","):
+        first, _, last = part.partition("-")
+        covered.update(range(int(first), int(last or first) + 1))
+    return covered
+
+
+def window_days(days):
+    return len(covered_days(days))
+
+
+def validate_warm_window(queue_name, window, dynamic_nodes):
+    window_days(window["days"])
+    if not 0 <= window["start_hour"] < window["end_hour"] <= 24:
+        raise ValueError(
+            f"Queue '{queue_name}' warm window hours must satisfy 0 <= start_hour < end_hour <= 24"
+        )
+    if not 1 <= window["nodes"] <= dynamic_nodes:
+        raise ValueError(
+            f"Queue '{queue_name}' warm window keeps {window['nodes']} nodes "
+            f"but only {dynamic_nodes} dynamic nodes exist"
+        )
+
+
+def warm_window_cron(queue_name, compute_resource_name, window):
+    """Cron lines that power up a queue's warm nodes for a window and release them."""
+    nodes = f"{queue_name}-dy-{compute_resource_name}-[1-{window['nodes']}]"
+    end_days = window["days"]
+    if window["end_hour"] == 24:
+        # Midnight at the end of a day is 00:00 of the day after
+        next_days = sorted((day + 1) % 7 for day in covered_days(end_days))
+        end_days = ",".join(str(day) for day in next_days)
+    return [
+        f"0 {window['start_hour']} * * {window['days']} root {SCONTROL} update "
+        f"SuspendExcNodes+={nodes} && {SCONTROL} update NodeName={nodes} State=POWER_UP",
+        f"0 {window['end_hour'] % 24} * * {end_days} root {SCONTROL} update "
+        f"SuspendExcNodes-={nodes}",
+    ]
+
+
+def idle_node_hours(static_nodes, windows):
+    """Worst-case node-hours per week spent idle by warm settings."""
+    hours = static_nodes * 24 * 7
+    for window in windows:
+        hours += (
+            window["nodes"]
+            * (window["end_hour"] - window["start_hour"])
+            * window_days(window["days"])
+        )
+    return hours
@@ -0,0 +1,30 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+DEFAULT_SLURM_DB_CONFIG = {
+    "user_name": "slurm",
+    "min_capacity": 0.5,
+    "max_capacity": 2,
+    "backup_retention_days": 7,
+}
+
+# Aurora Serverless v2 capacity units, in steps of 0.5
+MIN_ACU = 0.5
+MAX_ACU = 128
+
+
+def slurm_db_config(config):
+    """Validated accounting database settings, None when config has no slurm_db block."""
+    if "slurm_db" not in config:
+        return None
+    slurm_db = dict(DEFAULT_SLURM_DB_CONFIG, **config["slurm_db"])
+    for key in ("min_capacity", "max_capacity"):
+        if not MIN_ACU <= slurm_db[key] <= MAX_ACU or (slurm_db[key] * 2) % 1:
+            raise ValueError(
+                f"slurm_db {key} must be a multiple of 0.5 between {MIN_ACU} and {MAX_ACU} ACUs"
+            )
+    if slurm_db["min_capacity"] > slurm_db["max_capacity"]:
+        raise ValueError("slurm_db min_capacity exceeds max_capacity")
+    if not 1 <= slurm_db["backup_retention_days"] <= 35:
+        raise ValueError("slurm_db backup_retention_days must be 1-35")
+    return slurm_db
@@ -0,0 +1,62 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+# Backend -> how ParallelCluster mounts it, in SharedStorage order
+STORAGE_BACKENDS = {
+    "efs": {
+        "name": "EfsFromCDK",
+        "storage_type": "Efs",
+        "mount_dir": "/efs",
+        "settings": "EfsSettings",
+        "id_key": "FileSystemId",
+        "existing_id": "file_system_id",
+    },
+    "lustre": {
+        "name": "LustreFromCDK",
+        "storage_type": "FsxLustre",
+        "mount_dir": "/lustre",
+        "settings": "FsxLustreSettings",
+        "id_key": "FileSystemId",
+        "existing_id": "file_system_id",
+    },
+    "zfs": {
+        "name": "ZfsFromCDK",
+        "storage_type": "FsxOpenZfs",
+        "mount_dir": "/zfs",
+        "settings": "FsxOpenZfsSettings",
+        "id_key": "VolumeId",
+        "existing_id": "volume_id",
+    },
+}
+
+# EFS needs no settings, so it is created unless disabled
+DEFAULT_BACKEND_CONFIG = {"efs": {}}
+
+
+def storage_backend(config, backend):
+    """'create', 'existing' or None when the backend is not used by the cluster."""
+    backend_config = config.get(backend, DEFAULT_BACKEND_CONFIG.get(backend))
+    if backend_config is None or not backend_config.get("enabled", True):
+        return None
+    if "existing" not in backend_config:
+        return "create"
+
+    existing = backend_config["existing"]
+    for key in (STORAGE_BACKENDS[backend]["existing_id"], "security_group_id"):
+        if key not in existing:
+            raise ValueError(f"Existing {backend} filesystem needs '{key}'")
+    return "existing"
+
+
+def created_backends(config):
+    return [backend for backend in STORAGE_BACKENDS if storage_backend(config, backend) == "create"]
+
+
+def shared_storage_entry(backend, storage_id):
+    spec = STORAGE_BACKENDS[backend]
+    return {
+        "Name": spec["name"],
+        "StorageType": spec["storage_type"],
+        "MountDir": spec["mount_dir"],
+        spec["settings"]: {spec["id_key"]: storage_id},
+    }
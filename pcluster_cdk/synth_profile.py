@@ -0,0 +1,164 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import contextlib
+import json
+import os
+import resource
+import sys
+import time
+
+import jsii
+from aws_cdk import IAspect
+
+# Set to 1 to profile synth, the report is written next to the templates
+PROFILE_ENV = "CDK_SYNTH_PROFILE"
+REPORT_NAME = "synth-profile.json"
+
+
+def jsii_kernel_pids():
+    """The jsii runtime process and its children, which hold the constructs."""
+    try:
+        pid = jsii.kernel.provider._process._process.pid
+    except AttributeError:
+        return []
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", "r") as children:
+            pids += [int(child) for child in children.read().split()]
+    except OSError:
+        return []
+    return pids
+
+
+def jsii_kernel_memory():
+    """(RSS, peak RSS) in MiB of the jsii kernel, None without /proc."""
+    rss = peak = 0
+    for pid in jsii_kernel_pids():
+        try:
+            with open(f"/proc/{pid}/status", "r") as status:
+                fields = dict(line.split(":", 1) for line in status)
+        except OSError:
+            return None
+        rss += int(fields["VmRSS"].split()[0])
+        peak += int(fields["VmHWM"].split()[0])
+    return (rss / 1024, peak / 1024) if rss else None
+
+
+@jsii.implements(IAspect)
+class TimedAspect:
+    """Wraps an aspect to accumulate the time spent in its visits."""
+
+    def __init__(self, aspect):
+        self.aspect = aspect
+        self.seconds = 0.0
+        self.visits = 0
+
+    def visit(self, node):
+        start = time.perf_counter()
+        self.aspect.visit(node)
+        self.seconds += time.perf_counter() - start
+        self.visits += 1
+
+
+class SynthProfiler:
+    """Wall time and jsii kernel memory per phase of app.py, no-op when disabled.
+
+    Constructs live in the jsii node processes, so memory is their RSS read
+    from /proc around each phase; it is left out on systems without /proc.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.phases = []
+        self.aspects = {}
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.environ.get(PROFILE_ENV, "") not in ("", "0"))
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        if not self.enabled:
+            yield
+            return
+        before = jsii_kernel_memory()
+        start = time.perf_counter()
+        yield
+        phase = {"name": name, "seconds": time.perf_counter() - start}
+        after = jsii_kernel_memory()
+        if before and after:
+            phase["kernel_rss_mib"] = after[0]
+            phase["kernel_rss_growth_mib"] = after[0] - before[0]
+        self.phases.append(phase)
+
+    def aspect(self, name, aspect):
+        if not self.enabled:
+            return aspect
+        self.aspects[name] = TimedAspect(aspect)
+        return self.aspects[name]
+
+    def report(self, app, assembly):
+        phases = [dict(phase) for phase in self.phases]
+        # Aspects run inside synth, report them as phases of their own
+        for name, aspect in self.aspects.items():
+            phases.append(
+                {"name": name, "seconds": aspect.seconds, "visits": aspect.visits}
+            )
+            for phase in phases:
+                if phase["name"] == "synth":
+                    phase["seconds"] -= aspect.seconds
+
+        stacks = []
+        for artifact in assembly.stacks:
+            stack = app.node.find_child(artifact.stack_name)
+            stacks.append(
+                {
+                    "name": artifact.stack_name,
+                    "constructs": len(stack.node.find_all()),
+                    "template_bytes": os.path.getsize(artifact.template_full_path),
+                }
+            )
+
+        kernel_memory = jsii_kernel_memory()
+        return {
+            "phases": phases,
+            "stacks": stacks,
+            "total_seconds": sum(phase["seconds"] for phase in self.phases),
+            "max_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "kernel_max_rss_mib": kernel_memory[1] if kernel_memory else None,
+        }
+
+    def write_report(self, app, assembly):
+        if not self.enabled:
+            return None
+        report = self.report(app, assembly)
+        with open(os.path.join(assembly.directory, REPORT_NAME), "w") as report_json:
+            json.dump(report, report_json, indent=2)
+        print(render_summary(report), file=sys.stderr)
+        return report
+
+
+def render_summary(report):
+    lines = ["Synth profile:"]
+    for phase in report["phases"]:
+        if "visits" in phase:
+            memory = f", {phase['visits']:,} visits"
+        elif "kernel_rss_mib" in phase:
+            memory = (
+                f", kernel {phase['kernel_rss_mib']:.0f} MiB "
+                f"({phase['kernel_rss_growth_mib']:+.1f})"
+            )
+        else:
+            memory = ""
+        lines.append(f"  {phase['name']:<28} {phase['seconds']:8.2f}s{memory}")
+    for stack in report["stacks"]:
+        lines.append(
+            f"  {stack['name']:<28} {stack['constructs']:6,} constructs "
+            f"{stack['template_bytes'] / 1024:8.1f} KiB template"
+        )
+    total = f"  total {report['total_seconds']:.2f}s, max RSS {report['max_rss_mib']:.0f} MiB"
+    if report["kernel_max_rss_mib"] is not None:
+        total += f", jsii kernel max RSS {report['kernel_max_rss_mib']:.0f} MiB"
+    lines.append(total)
+    return "\n".join(lines)
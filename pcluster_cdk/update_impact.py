@@ -0,0 +1,205 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+
+# ParallelCluster update policies, from least to most disruptive
+IGNORED = "IGNORED"
+SUPPORTED = "SUPPORTED"
+QUEUE_UPDATE_STRATEGY = "QUEUE_UPDATE_STRATEGY"
+COMPUTE_FLEET_STOP = "COMPUTE_FLEET_STOP"
+UNSUPPORTED = "UNSUPPORTED"
+
+POLICY_ORDER = (IGNORED, SUPPORTED, QUEUE_UPDATE_STRATEGY, COMPUTE_FLEET_STOP, UNSUPPORTED)
+
+# Settings without an entry are assumed to need the compute fleet stopped
+DEFAULT_POLICY = COMPUTE_FLEET_STOP
+
+POLICY_SUMMARIES = {
+    IGNORED: "no changes that affect the cluster",
+    SUPPORTED: "updates without interrupting the compute fleet",
+    QUEUE_UPDATE_STRATEGY: "replaces the nodes of the affected queues",
+    COMPUTE_FLEET_STOP: "needs the compute fleet stopped before cdk deploy",
+    UNSUPPORTED: "cannot be updated, the change needs a new cluster",
+}
+
+
+def max_count_policy(old, new):
+    """Growing a compute resource is live, shrinking it replaces its nodes."""
+    if old is not None and new is not None and int(new) >= int(old):
+        return SUPPORTED
+    return QUEUE_UPDATE_STRATEGY
+
+
+# Setting path -> update policy, as documented for ParallelCluster 3.7. Paths
+# use "*" for a named list item and match every setting below them; the first
+# match wins, so specific paths come before the sections that contain them.
+UPDATE_POLICIES = [
+    ("Image.Os", UNSUPPORTED),
+    ("Image.CustomAmi", UNSUPPORTED),
+    ("HeadNode.Networking.AdditionalSecurityGroups", SUPPORTED),
+    ("HeadNode.Ssh.AllowedIps", SUPPORTED),
+    ("HeadNode.Iam.AdditionalIamPolicies", SUPPORTED),
+    ("HeadNode.Iam.S3Access", SUPPORTED),
+    ("HeadNode.CustomActions.OnNodeUpdated", SUPPORTED),
+    ("HeadNode", UNSUPPORTED),
+    ("Scheduling.Scheduler", UNSUPPORTED),
+    ("Scheduling.SlurmSettings.QueueUpdateStrategy", SUPPORTED),
+    ("Scheduling.SlurmSettings.Dns", UNSUPPORTED),
+    ("Scheduling.SlurmSettings", COMPUTE_FLEET_STOP),
+    ("Scheduling.SlurmQueues.*.ComputeResources.*.MaxCount", max_count_policy),
+    ("Scheduling.SlurmQueues.*.Iam.AdditionalIamPolicies", SUPPORTED),
+    ("Scheduling.SlurmQueues.*.Iam.S3Access", SUPPORTED),
+    ("Scheduling.SlurmQueues.*", QUEUE_UPDATE_STRATEGY),
+    ("SharedStorage.*", UNSUPPORTED),
+    ("Monitoring", SUPPORTED),
+    ("Tags", UNSUPPORTED),
+    ("DevSettings", IGNORED),
+]
+
+# Named list -> (policy to add an item, policy to remove one)
+LIST_POLICIES = {
+    "Scheduling.SlurmQueues": (SUPPORTED, COMPUTE_FLEET_STOP),
+    "Scheduling.SlurmQueues.*.ComputeResources": (SUPPORTED, COMPUTE_FLEET_STOP),
+    "SharedStorage": (QUEUE_UPDATE_STRATEGY, COMPUTE_FLEET_STOP),
+}
+
+
+def is_intrinsic(value):
+    return isinstance(value, dict) and len(value) == 1 and (
+        "Ref" in value or next(iter(value)).startswith("Fn::")
+    )
+
+
+def is_named_list(value):
+    return (
+        isinstance(value, list)
+        and value
+        and all(isinstance(item, dict) and "Name" in item for item in value)
+    )
+
+
+def config_changes(old, new, path=()):
+    """(path, old, new) for every changed setting, None for a missing side.
+
+    Lists of named items, such as queues, are matched by name; other lists
+    and CloudFormation intrinsics are compared as a whole.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        if not (is_intrinsic(old) or is_intrinsic(new)):
+            changes = []
+            for key in sorted(set(old) | set(new)):
+                changes += config_changes(old.get(key), new.get(key), path + (key,))
+            return changes
+    if is_named_list(old) and is_named_list(new):
+        old_items = {item["Name"]: item for item in old}
+        new_items = {item["Name"]: item for item in new}
+        changes = []
+        for name in sorted(set(old_items) | set(new_items)):
+            changes += config_changes(old_items.get(name), new_items.get(name), path + (name,))
+        return changes
+    return [(path, old, new)]
+
+
+def matches(pattern, path, prefix=True):
+    parts = pattern.split(".")
+    if len(path) < len(parts) or (not prefix and len(path) != len(parts)):
+        return False
+    return all(part in ("*", element) for part, element in zip(parts, path))
+
+
+def update_policy(path, old, new):
+    """Policy for one change and whether it came from the table."""
+    if old is None or new is None:
+        for pattern, (added, removed) in LIST_POLICIES.items():
+            if matches(pattern, path[:-1], prefix=False):
+                return (added if old is None else removed), True
+    for pattern, policy in UPDATE_POLICIES:
+        if matches(pattern, path):
+            return (policy(old, new) if callable(policy) else policy), True
+    return DEFAULT_POLICY, False
+
+
+def most_disruptive(policies):
+    return max(policies, key=POLICY_ORDER.index, default=IGNORED)
+
+
+def queue_names(cluster_config):
+    return [queue["Name"] for queue in cluster_config.get("Scheduling", {}).get("SlurmQueues", [])]
+
+
+def update_impact(old, new):
+    """Classify the changes between two cluster configurations.
+
+    Returns the changes with their policy, the overall policy of the update
+    and the impact on each queue of the previous configuration: "drain" (or
+    the configured QueueUpdateStrategy) for queues whose nodes are replaced,
+    "stop" when the whole fleet has to be stopped first, "added" or
+    "removed".
+    """
+    changes = []
+    replaced = set()
+    old_queues = queue_names(old)
+    new_queues = queue_names(new)
+    for path, before, after in config_changes(old, new):
+        policy, known = update_policy(path, before, after)
+        if policy == QUEUE_UPDATE_STRATEGY:
+            # Queue settings replace that queue, cluster-wide ones such as
+            # new shared storage reach every queue
+            if path[:2] == ("Scheduling", "SlurmQueues"):
+                replaced.add(path[2])
+            else:
+                replaced.update(old_queues)
+        changes.append(
+            {
+                "path": ".".join(path),
+                "old": before,
+                "new": after,
+                "policy": policy,
+                "known": known,
+            }
+        )
+    policy = most_disruptive(change["policy"] for change in changes)
+
+    # Without a QueueUpdateStrategy, queue changes also need the fleet stopped
+    strategy = (
+        new.get("Scheduling", {})
+        .get("SlurmSettings", {})
+        .get("QueueUpdateStrategy", COMPUTE_FLEET_STOP)
+    )
+    if policy == QUEUE_UPDATE_STRATEGY and strategy == COMPUTE_FLEET_STOP:
+        policy = COMPUTE_FLEET_STOP
+    queues = {name: "added" for name in new_queues if name not in old_queues}
+    for name in old_queues:
+        if name not in new_queues:
+            queues[name] = "removed"
+        elif policy in (COMPUTE_FLEET_STOP, UNSUPPORTED):
+            queues[name] = "stop"
+        elif name in replaced:
+            queues[name] = strategy.lower()
+
+    return {"policy": policy, "changes": changes, "queues": queues}
+
+
+def render_change(change):
+    if change["old"] is None:
+        return "added"
+    if change["new"] is None:
+        return "removed"
+    return " -> ".join(
+        value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+        for value in (change["old"], change["new"])
+    )
+
+
+def render_report(name, impact):
+    lines = [f"{name}: {POLICY_SUMMARIES[impact['policy']]}"]
+    for change in impact["changes"]:
+        policy = change["policy"] if change["known"] else f"{change['policy']} (assumed)"
+        lines.append(f"  {policy:<28} {change['path']}: {render_change(change)}")
+    for queue, effect in sorted(impact["queues"].items()):
+        lines.append(f"  queue {queue}: {effect}")
+    return "\n".join(lines)
+
@@ -0,0 +1,77 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+GATEWAY_ENDPOINT_SERVICES = ("s3", "dynamodb")
+
+# Interface endpoint services, com.amazonaws.<region>.<name>
+INTERFACE_ENDPOINT_SERVICES = (
+    "s3",
+    "dynamodb",
+    "ec2",
+    "ec2messages",
+    "cloudformation",
+    "logs",
+    "monitoring",
+    "sts",
+    "ssm",
+    "ssmmessages",
+    "secretsmanager",
+    "kms",
+    "elasticfilesystem",
+    "fsx",
+    "imagebuilder",
+    "ecr.api",
+    "ecr.dkr",
+    "rds",
+    "sqs",
+    "sns",
+)
+
+# AWS services reached by ParallelCluster nodes -> (purpose, nodes calling it).
+# The head node sits in the public subnet and reaches them without NAT.
+CLUSTER_SERVICES = {
+    "s3": ("node bootstrap, custom actions and data repositories", ("head", "compute")),
+    "dynamodb": ("ParallelCluster cluster state table", ("head", "compute")),
+    "ec2": ("compute fleet scaling", ("head",)),
+    "cloudformation": ("cluster stack signals and node configuration", ("head", "compute")),
+    "logs": ("CloudWatch Logs agent", ("head", "compute")),
+    "monitoring": ("CloudWatch metrics", ("head", "compute")),
+    "sts": ("instance role credentials", ("head", "compute")),
+    "ssm": ("Session Manager", ("head", "compute")),
+    "ssmmessages": ("Session Manager", ("head", "compute")),
+    "ec2messages": ("Session Manager", ("head", "compute")),
+    "secretsmanager": ("secrets read by the head node", ("head",)),
+}
+
+DEFAULT_ENDPOINTS_CONFIG = {"gateway": [], "interface": []}
+
+
+def endpoints_config(vpc_config):
+    endpoints = dict(DEFAULT_ENDPOINTS_CONFIG, **vpc_config.get("endpoints", {}))
+    for service in endpoints["gateway"]:
+        if service not in GATEWAY_ENDPOINT_SERVICES:
+            raise ValueError(
+                f"'{service}' has no gateway endpoint, expected one of {GATEWAY_ENDPOINT_SERVICES}"
+            )
+    for service in endpoints["interface"]:
+        if service not in INTERFACE_ENDPOINT_SERVICES:
+            raise ValueError(
+                f"'{service}' is not a known interface endpoint service, expected one of "
+                f"{INTERFACE_ENDPOINT_SERVICES}"
+            )
+    duplicates = set(endpoints["gateway"]) & set(endpoints["interface"])
+    if duplicates:
+        raise ValueError(
+            f"Services {sorted(duplicates)} are configured as both gateway and interface endpoints"
+        )
+    return endpoints
+
+
+def nat_dependent_services(endpoints):
+    """Services compute nodes reach through NAT from the private subnets."""
+    covered = set(endpoints["gateway"]) | set(endpoints["interface"])
+    return {
+        service: purpose
+        for service, (purpose, nodes) in CLUSTER_SERVICES.items()
+        if "compute" in nodes and service not in covered
+    }
@@ -0,0 +1,57 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import re
+
+ZFS_RECORD_SIZES_KIB = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
+ZFS_COMPRESSION_TYPES = ("NONE", "ZSTD", "LZ4")
+ZFS_VOLUME_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9\-]{0,25}$")
+
+# Mount points already used by the cluster's other shared storage
+RESERVED_MOUNT_DIRS = ("/efs", "/lustre", "/zfs")
+
+DEFAULT_NFS_OPTIONS = ["rw", "crossmnt", "async", "no_root_squash"]
+
+DEFAULT_ZFS_VOLUME = {
+    "record_size": 128,
+    "compression": "ZSTD",
+    "nfs_options": DEFAULT_NFS_OPTIONS,
+}
+
+
+def zfs_volumes(zfs_config):
+    """Return the validated child volumes declared under zfs_config["volumes"]."""
+    volumes = []
+    for volume in zfs_config.get("volumes", []):
+        volume = dict(DEFAULT_ZFS_VOLUME, **volume)
+        name = volume["name"]
+        volume.setdefault("mount_dir", f"/zfs-{name}")
+
+        if not ZFS_VOLUME_NAME_PATTERN.match(name):
+            raise ValueError(
+                f"ZFS volume name '{name}' must be lowercase letters, digits or hyphens, at most 26 characters"
+            )
+        if volume["mount_dir"] in RESERVED_MOUNT_DIRS:
+            raise ValueError(
+                f"ZFS volume '{name}' mount_dir {volume['mount_dir']} is already used by the cluster"
+            )
+        if volume["record_size"] not in ZFS_RECORD_SIZES_KIB:
+            raise ValueError(
+                f"ZFS volume '{name}' record_size must be one of {ZFS_RECORD_SIZES_KIB} KiB"
+            )
+        if volume["compression"] not in ZFS_COMPRESSION_TYPES:
+            raise ValueError(
+                f"ZFS volume '{name}' compression must be one of {ZFS_COMPRESSION_TYPES}"
+            )
+        if "reservation_gib" in volume and volume["reservation_gib"] > volume.get(
+            "quota_gib", volume["reservation_gib"]
+        ):
+            raise ValueError(f"ZFS volume '{name}' reservation_gib exceeds quota_gib")
+        for other in volumes:
+            if other["name"] == name or other["mount_dir"] == volume["mount_dir"]:
+                raise ValueError(
+                    f"ZFS volumes '{other['name']}' and '{name}' share a name or mount_dir"
+                )
+
+        volumes.append(volume)
+    return volumes
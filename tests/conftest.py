@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import functools
+import json
+import os
+
+import aws_cdk as cdk
+import pytest
+
+from pcluster_cdk.hpc_stacks import build_hpc_stacks
+
+TESTS_DIR = os.path.dirname(__file__)
+CONFIGS_DIR = os.path.join(TESTS_DIR, "configs")
+SNAPSHOTS_DIR = os.path.join(TESTS_DIR, "snapshots")
+
+# Dummy environment, availability zones and AMI lookups resolve to placeholders
+# without AWS calls
+DUMMY_ENV = cdk.Environment(account="123456789012", region="us-east-1")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        help="Rewrite stored snapshots from the synthesized templates",
+    )
+
+
+@pytest.fixture
+def update_snapshots(request):
+    return request.config.getoption("--update-snapshots")
+
+
+def sample_configs():
+    return sorted(name[: -len(".json")] for name in os.listdir(CONFIGS_DIR))
+
+
+def load_config(name):
+    with open(os.path.join(CONFIGS_DIR, name + ".json"), "r") as config_json:
+        return json.load(config_json)
+
+
+@functools.lru_cache(maxsize=None)
+def build_stacks(config_name):
+    """Build the stacks app.py builds for a sample config, keyed by stack name."""
+    config = load_config(config_name)
+    with open(os.path.join(TESTS_DIR, "..", "cdk.json"), "r") as cdk_json:
+        context = json.load(cdk_json)["context"]
+    app = cdk.App(context=context)
+
+    stacks = build_hpc_stacks(app, config, DUMMY_ENV)
+    return {stack.stack_name: stack for stack in stacks.values()}
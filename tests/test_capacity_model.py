@@ -0,0 +1,13 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+from aws_cdk.assertions import Annotations, Match
+
+from conftest import build_stacks
+
+
+@pytest.mark.xdist_group("default")
+def test_default_config_passes_the_capacity_model():
+    annotations = Annotations.from_stack(build_stacks("default")["HpcCluster"])
+    assert annotations.find_warning("*", Match.string_like_regexp("bandwidth|ratio")) == []
@@ -0,0 +1,28 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+from aws_cdk.assertions import Template
+
+from conftest import build_stacks
+
+
+@pytest.mark.xdist_group("capacity-reservations")
+def test_reserved_compute_resources_skip_dedicated_placement_groups():
+    template = Template.from_stack(build_stacks("capacity-reservations")["HpcCluster"])
+    (cluster,) = template.find_resources("Custom::PClusterCluster").values()
+    placement = {
+        queue["Name"]: queue["ComputeResources"][0]["Networking"]["PlacementGroup"]
+        for queue in cluster["Properties"]["ClusterConfiguration"]["Scheduling"]["SlurmQueues"]
+    }
+
+    # Created and resource group reservations are outside any placement group
+    assert placement["spr1"] == {"Enabled": "false"}
+    assert placement["icl3"] == {"Enabled": "false"}
+    assert placement["icl2"] == {"Enabled": "true", "Name": "hpc-icl-existing"}
+    assert placement["icl1"]["Name"] == {"Ref": "HPCPGicl1c6i"}
+    assert sorted(template.find_resources("AWS::EC2::PlacementGroup")) == [
+        "HPCPGicl1c6i",
+        "HPCPGspr2c7i",
+        "HPCPGspr3c7i",
+    ]
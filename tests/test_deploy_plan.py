@@ -0,0 +1,41 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from conftest import build_stacks, load_config
+
+from pcluster_cdk.clusters import cluster_configs, cluster_stack_id
+from pcluster_cdk.deploy_plan import deploy_waves
+
+
+def test_clusters_deploy_in_one_wave():
+    waves = deploy_waves(
+        {
+            "HpcNetwork": set(),
+            "HpcClusterProvider": set(),
+            "HpcEfsStack": {"HpcNetwork"},
+            "HpcLustreStack": {"HpcNetwork"},
+            "HpcCluster-a": {"HpcClusterProvider", "HpcEfsStack", "HpcLustreStack"},
+            "HpcCluster-b": {"HpcClusterProvider", "HpcEfsStack", "HpcLustreStack"},
+        }
+    )
+    assert waves == [
+        ["HpcClusterProvider", "HpcNetwork"],
+        ["HpcEfsStack", "HpcLustreStack"],
+        ["HpcCluster-a", "HpcCluster-b"],
+    ]
+
+
+def test_circular_dependencies_are_rejected():
+    with pytest.raises(ValueError, match="circular"):
+        deploy_waves({"A": {"B"}, "B": {"A"}})
+
+
+@pytest.mark.xdist_group("multi-cluster")
+def test_clusters_depend_on_the_key_pairs():
+    config = load_config("multi-cluster")
+    stacks = build_stacks("multi-cluster")
+    for cluster_config in cluster_configs(config):
+        cluster_stack = stacks[cluster_stack_id(config, cluster_config)]
+        assert stacks["HpcKeypairs"] in cluster_stack.dependencies
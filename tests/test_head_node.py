@@ -0,0 +1,29 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from pcluster_cdk.head_node import DEFAULT_HEAD_NODE, head_node_size
+
+SMALL_FLEET = (16, 1024, 2)
+LARGE_FLEET = (120, 19200, 6)
+
+
+def test_default_head_node_is_kept_without_settings():
+    assert head_node_size({}, SMALL_FLEET) == (*DEFAULT_HEAD_NODE, [])
+
+
+def test_default_head_node_warns_when_the_fleet_outgrows_it():
+    instance_type, root_volume_size, warnings = head_node_size({}, LARGE_FLEET)
+    assert (instance_type, root_volume_size) == DEFAULT_HEAD_NODE
+    assert len(warnings) == 1
+    assert "m7i.2xlarge with 200 GiB recommended" in warnings[0]
+
+
+def test_table_applies_when_head_node_is_set():
+    assert head_node_size({"head_node": {}}, LARGE_FLEET) == ("m7i.2xlarge", 200, [])
+
+
+def test_smaller_overrides_warn():
+    config = {"head_node": {"instance_type": "m7i.large", "root_volume_size": 100}}
+    instance_type, root_volume_size, warnings = head_node_size(config, LARGE_FLEET)
+    assert (instance_type, root_volume_size) == ("m7i.large", 100)
+    assert len(warnings) == 2
@@ -0,0 +1,34 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.instance_types import instance_spec, supports_efa
+
+
+@pytest.mark.parametrize(
+    "instance_type", ["c5n.9xlarge", "c5n.18xlarge", "c5.18xlarge", "c5.24xlarge", "hpc7g.16xlarge"]
+)
+def test_efa_instance_types(instance_type):
+    assert supports_efa(instance_type)
+
+
+@pytest.mark.parametrize("instance_type", ["c5n.4xlarge", "c6i.16xlarge", "m7i.2xlarge"])
+def test_instance_types_without_efa(instance_type):
+    assert not supports_efa(instance_type)
+
+
+@pytest.mark.parametrize(
+    "instance_type,key,value",
+    [
+        ("hpc6id.32xlarge", "instance_store_gb", 15200),
+        ("c6id.32xlarge", "instance_store_gb", 7600),
+        ("p4d.24xlarge", "network_gbps", 400),
+        ("p5.48xlarge", "network_gbps", 3200),
+        ("c6in.32xlarge", "network_gbps", 200),
+        ("hpc7g.16xlarge", "architecture", "arm64"),
+        ("c7i.48xlarge", "vcpus", 192),
+    ],
+)
+def test_catalog_entries(instance_type, key, value):
+    assert instance_spec(instance_type)[key] == value
@@ -0,0 +1,59 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+from aws_cdk.assertions import Template
+
+from conftest import build_stacks, load_config
+
+from pcluster_cdk.lustre_data import preload_args, preload_config
+
+
+def cluster_config(config_name):
+    template = Template.from_stack(build_stacks(config_name)["HpcCluster"]).to_json()
+    for resource in template["Resources"].values():
+        if resource["Type"] == "Custom::PClusterCluster":
+            return resource["Properties"]["ClusterConfiguration"]
+
+
+def test_preload_args():
+    preload = preload_config(
+        {"preload": {"paths": ["/inputs", "/reference/genomes"], "parallelism": 4}}
+    )
+    assert preload_args(preload, "/lustre") == [
+        "/lustre",
+        "4",
+        "false",
+        "/inputs",
+        "/reference/genomes",
+    ]
+
+
+def test_preload_timeout_is_bounded():
+    with pytest.raises(ValueError, match="timeout_minutes"):
+        preload_config({"preload": {"paths": ["/inputs"], "timeout_minutes": 721}})
+
+
+@pytest.mark.xdist_group("lustre-data-repositories")
+def test_preload_runs_on_the_head_node():
+    head_node = cluster_config("lustre-data-repositories")["HeadNode"]
+    preload = load_config("lustre-data-repositories")["lustre"]["preload"]
+
+    actions = [
+        action
+        for action in head_node["CustomActions"]["OnNodeConfigured"]["Sequence"]
+        if action["Args"][:1] == ["/lustre"]
+    ]
+    assert [action["Args"] for action in actions] == [
+        ["/lustre", "16", "false", *preload["paths"]]
+    ]
+    assert actions[0]["Script"].startswith("s3://")
+    assert actions[0]["Script"].endswith(".sh")
+
+
+@pytest.mark.xdist_group("lustre-data-repositories")
+def test_preload_raises_the_bootstrap_timeout():
+    assert cluster_config("lustre-data-repositories")["DevSettings"] == {
+        "Timeouts": {"HeadNodeBootstrapTimeout": 180 * 60}
+    }
+    assert "DevSettings" not in cluster_config("default")
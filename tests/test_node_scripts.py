@@ -0,0 +1,99 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import os
+import subprocess
+
+from pcluster_cdk.hpc_cluster_stack import NODE_SCRIPTS_DIR
+
+
+def run_script(tmp_path, script, args, commands, env=None):
+    """Run a node script with fake commands first on PATH, logging their calls."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir(exist_ok=True)
+    log = tmp_path / "calls.log"
+    for name, body in commands.items():
+        fake = bin_dir / name
+        fake.write_text(f'#!/bin/bash\necho "{name} $*" >> "{log}"\n{body}\n')
+        fake.chmod(0o755)
+    result = subprocess.run(
+        ["bash", os.path.join(NODE_SCRIPTS_DIR, script), *args],
+        env=dict(os.environ, PATH=f"{bin_dir}:{os.environ['PATH']}", **(env or {})),
+        capture_output=True,
+        text=True,
+    )
+    calls = log.read_text().splitlines() if log.exists() else []
+    return result, calls
+
+
+def test_mount_lustre_refuses_a_directory_holding_another_filesystem(tmp_path):
+    mount_dir = str(tmp_path / "scratch")
+    result, calls = run_script(
+        tmp_path,
+        "mount_lustre.sh",
+        ["fs-1.fsx.amazonaws.com", "abcdef", mount_dir],
+        {"mountpoint": "exit 0", "findmnt": "echo xfs", "mount": "exit 0"},
+    )
+    assert result.returncode == 1
+    assert f"{mount_dir} already holds a xfs filesystem" in result.stderr
+    assert not any(call.startswith("mount ") for call in calls)
+
+
+def test_mount_lustre_keeps_an_existing_lustre_mount(tmp_path):
+    result, calls = run_script(
+        tmp_path,
+        "mount_lustre.sh",
+        ["fs-1.fsx.amazonaws.com", "abcdef", str(tmp_path / "scratch")],
+        {"mountpoint": "exit 0", "findmnt": "echo lustre", "mount": "exit 0"},
+    )
+    assert result.returncode == 0, result.stderr
+    assert not any(call.startswith("mount ") for call in calls)
+
+
+def run_preload(tmp_path, stub, lfs="exit 0"):
+    data = tmp_path / "lustre" / "datasets"
+    data.mkdir(parents=True)
+    for name in ("a", "b", "c"):
+        (data / name).write_text(name)
+    return run_script(
+        tmp_path,
+        "preload_lustre.sh",
+        [str(tmp_path / "lustre"), "2", stub, "/datasets"],
+        {"sinfo": "printf 'icl1\\nspr1\\nicl1\\n'", "scontrol": "exit 0", "lfs": lfs},
+        env={"SLURM_BIN": str(tmp_path / "bin")},
+    )
+
+
+def partition_states(calls):
+    return [call.split(" ", 2)[2] for call in calls if call.startswith("scontrol ")]
+
+
+HELD_AND_RELEASED = [
+    "PartitionName=icl1 State=DOWN",
+    "PartitionName=spr1 State=DOWN",
+    "PartitionName=icl1 State=UP",
+    "PartitionName=spr1 State=UP",
+]
+
+
+def test_preload_stub_counts_files_without_restoring(tmp_path):
+    result, calls = run_preload(tmp_path, "true")
+    assert result.returncode == 0, result.stderr
+    assert "would restore 3 files" in result.stdout
+    assert not any(call.startswith("lfs ") for call in calls)
+    assert partition_states(calls) == HELD_AND_RELEASED
+
+
+def test_preload_restores_and_waits(tmp_path):
+    result, calls = run_preload(tmp_path, "false")
+    assert result.returncode == 0, result.stderr
+    assert any(call.startswith("lfs hsm_restore ") for call in calls)
+    assert any(call.startswith("lfs hsm_action ") for call in calls)
+    assert partition_states(calls) == HELD_AND_RELEASED
+
+
+def test_failed_preload_releases_the_partitions(tmp_path):
+    result, calls = run_preload(tmp_path, "false", lfs="exit 1")
+    assert result.returncode != 0
+    assert not any(call.startswith("lfs hsm_action ") for call in calls)
+    assert partition_states(calls) == HELD_AND_RELEASED
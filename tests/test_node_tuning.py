@@ -0,0 +1,74 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.node_tuning import TUNING_HEADER, render_tuning_script, tuning_config
+
+TUNING = {
+    "lustre": {
+        "parameters": {"max_rpcs_in_flight": 64, "lru_size": 0},
+        "stripes": [{"path": "/scratch", "count": -1, "size": "4M"}, {"path": "/home"}],
+    },
+    "efs": {"nconnect": 8},
+    "zfs": {"rsize": 1048576, "wsize": 1048576},
+}
+
+
+def script_lines(head_node, lustre_mount_dir="/lustre"):
+    """Lines of the rendered script after the shared header."""
+    script = render_tuning_script(
+        tuning_config({"tuning": TUNING}),
+        {"/efs": TUNING["efs"], "/zfs": TUNING["zfs"], "/zfs-home": {}},
+        lustre_mount_dir,
+        head_node,
+    )
+    assert script.startswith(TUNING_HEADER)
+    return script[len(TUNING_HEADER) :].lstrip("\n").splitlines()
+
+
+@pytest.mark.parametrize(
+    "tuning,message",
+    [
+        ({"lustre": {"parameters": {"max_pages": 1}}}, "Unknown Lustre client parameter"),
+        ({"lustre": {"stripes": [{"path": "scratch"}]}}, "absolute"),
+        ({"lustre": {"stripes": [{"path": "/scratch", "count": 0}]}}, "-1 or positive"),
+        ({"lustre": {"stripes": [{"path": "/scratch", "size": "4MB"}]}}, "stripe size"),
+        ({"efs": {"timeo": 600}}, "Unknown efs mount option"),
+        ({"zfs": {"nconnect": 17}}, "nconnect must be 1-16"),
+        ({"efs": {"rsize": 65535}}, "power of two"),
+        ({"zfs": {"wsize": 2097152}}, "power of two"),
+    ],
+)
+def test_invalid_tuning_is_rejected(tuning, message):
+    with pytest.raises(ValueError, match=message):
+        tuning_config({"tuning": tuning})
+
+
+def test_head_node_script():
+    assert script_lines(head_node=True) == [
+        "lctl set_param 'osc.*.max_rpcs_in_flight=64'",
+        "lctl set_param 'ldlm.namespaces.*.lru_size=0'",
+        "mkdir -p /lustre/scratch",
+        "lfs setstripe -c -1 -S 4M /lustre/scratch",
+        "mkdir -p /lustre/home",
+        "lfs setstripe -c -1 /lustre/home",
+        "remount_nfs /efs nconnect=8",
+        "remount_nfs /zfs rsize=1048576,wsize=1048576",
+    ]
+
+
+def test_compute_node_script_leaves_stripes_to_the_head_node():
+    assert script_lines(head_node=False) == [
+        "lctl set_param 'osc.*.max_rpcs_in_flight=64'",
+        "lctl set_param 'ldlm.namespaces.*.lru_size=0'",
+        "remount_nfs /efs nconnect=8",
+        "remount_nfs /zfs rsize=1048576,wsize=1048576",
+    ]
+
+
+def test_no_lustre_settings_without_lustre():
+    assert script_lines(head_node=True, lustre_mount_dir=None) == [
+        "remount_nfs /efs nconnect=8",
+        "remount_nfs /zfs rsize=1048576,wsize=1048576",
+    ]
@@ -0,0 +1,39 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.placement import placed_compute_config
+
+FAMILIES = {"icl": {"compute_resource": "c6i", "instance_type": "c6i.32xlarge"}}
+
+
+def colocate(*queues):
+    return {
+        "placement": {"policy": "colocate", "storage_az": 1},
+        "compute": {"families": FAMILIES, "queues": list(queues)},
+    }
+
+
+def test_colocate_moves_queues_to_the_storage_az():
+    compute_config = placed_compute_config(
+        colocate({"families": ["icl"], "azs": [0, 1, 2], "overrides": {"icl2": {"max_count": 4}}})
+    )
+    assert [entry["azs"] for entry in compute_config["queues"]] == [[1]]
+
+
+def test_colocate_rejects_entries_that_collapse_to_one_queue():
+    config = colocate(
+        {"families": ["icl"], "azs": [0], "max_count": 8},
+        {"families": ["icl"], "azs": [2], "max_count": 16},
+    )
+    with pytest.raises(ValueError, match="colocate moves compute.queues entries 0 and 1"):
+        placed_compute_config(config)
+
+
+def test_colocate_rejects_overrides_for_removed_queues():
+    config = colocate(
+        {"families": ["icl"], "azs": [0, 1], "overrides": {"icl1": {"max_count": 4}}}
+    )
+    with pytest.raises(ValueError, match="overrides for icl1 match no queue"):
+        placed_compute_config(config)
@@ -0,0 +1,157 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import copy
+
+import pytest
+
+from pcluster_cdk.queues import DEFAULT_COMPUTE_CONFIG, build_slurm_queues
+
+SUBNETS = ["subnet-1", "subnet-2", "subnet-3"]
+STORAGE_SECURITY_GROUPS = ["sg-efs", "sg-lustre", "sg-zfs"]
+EFA_SECURITY_GROUP = "sg-efa"
+
+COMPUTE_SETTINGS = {
+    "LocalStorage": {"RootVolume": {"Size": "200", "Encrypted": "true", "VolumeType": "gp3"}}
+}
+COMMON_COMPUTE_SETTINGS = {
+    "MinCount": "0",
+    "DisableSimultaneousMultithreading": "true",
+    "Networking": {"PlacementGroup": {"Enabled": "true"}},
+}
+
+
+def placement_group(queue_name, compute_resource_name):
+    return f"pg-{queue_name}-{compute_resource_name}"
+
+
+def hand_written_queues():
+    """The six queues the stack declared before the queue matrix existed."""
+    queues = []
+    for family, compute_resource, instance_type in (
+        ("icl", "c6i", "c6i.32xlarge"),
+        ("spr", "c7i", "c7i.48xlarge"),
+    ):
+        for az, subnet in enumerate(SUBNETS, start=1):
+            queues.append(
+                {
+                    "Name": f"{family}{az}",
+                    "CapacityType": "ONDEMAND",
+                    "JobExclusiveAllocation": "true",
+                    "ComputeSettings": COMPUTE_SETTINGS,
+                    "ComputeResources": [
+                        {
+                            "MaxCount": "20",
+                            "Name": compute_resource,
+                            "InstanceType": instance_type,
+                            "MinCount": "0",
+                            "DisableSimultaneousMultithreading": "true",
+                            "Efa": {"Enabled": "true"},
+                            "Networking": {"PlacementGroup": {"Enabled": "true"}},
+                        }
+                    ],
+                    "Networking": {
+                        "SubnetIds": [subnet],
+                        "AdditionalSecurityGroups": STORAGE_SECURITY_GROUPS,
+                    },
+                }
+            )
+    return queues
+
+
+def test_default_matrix_matches_the_hand_written_queues():
+    queues = build_slurm_queues(
+        copy.deepcopy(DEFAULT_COMPUTE_CONFIG),
+        SUBNETS,
+        COMPUTE_SETTINGS,
+        COMMON_COMPUTE_SETTINGS,
+        STORAGE_SECURITY_GROUPS,
+        efa_security_group=EFA_SECURITY_GROUP,
+        placement_group=placement_group,
+    )
+
+    expected = hand_written_queues()
+    for queue in expected:
+        # Since then each compute resource has its own named placement group
+        # and EFA queues carry the EFA security group
+        compute_resource = queue["ComputeResources"][0]
+        compute_resource["Networking"]["PlacementGroup"]["Name"] = placement_group(
+            queue["Name"], compute_resource["Name"]
+        )
+        queue["Networking"]["AdditionalSecurityGroups"] = STORAGE_SECURITY_GROUPS + [
+            EFA_SECURITY_GROUP
+        ]
+    assert sorted(queues, key=lambda queue: queue["Name"]) == expected
+
+
+def ephemeral_scratch_queues(ephemeral_scratch, shared_mount_dirs=()):
+    compute_config = {
+        "families": {"icld": {"compute_resource": "c6id", "instance_type": "c6id.32xlarge"}},
+        "queues": [
+            {
+                "families": ["icld"],
+                "azs": [0],
+                "max_count": 4,
+                "ephemeral_scratch": ephemeral_scratch,
+            }
+        ],
+    }
+    return build_slurm_queues(
+        compute_config,
+        SUBNETS,
+        COMPUTE_SETTINGS,
+        COMMON_COMPUTE_SETTINGS,
+        STORAGE_SECURITY_GROUPS,
+        efa_security_group=EFA_SECURITY_GROUP,
+        placement_group=placement_group,
+        shared_mount_dirs=shared_mount_dirs,
+    )
+
+
+def test_ephemeral_scratch_mount_dir():
+    (queue,) = ephemeral_scratch_queues(True, shared_mount_dirs=["/zfs-home", "/scratch"])
+    assert queue["ComputeSettings"]["LocalStorage"]["EphemeralVolume"] == {
+        "MountDir": "/local_scratch"
+    }
+
+
+@pytest.mark.parametrize("mount_dir", ["/lustre", "/zfs-home", "/scratch"])
+def test_ephemeral_scratch_cannot_reuse_shared_storage_mount_dirs(mount_dir):
+    with pytest.raises(ValueError, match=f"ephemeral_scratch {mount_dir} is already used"):
+        ephemeral_scratch_queues(mount_dir, shared_mount_dirs=["/zfs-home", "/scratch"])
+
+
+def test_instance_store_moves_off_shared_storage_at_the_default_mount_dir():
+    (queue,) = ephemeral_scratch_queues(False, shared_mount_dirs=["/scratch"])
+    assert queue["ComputeSettings"]["LocalStorage"]["EphemeralVolume"] == {
+        "MountDir": "/local_scratch"
+    }
+    (queue,) = ephemeral_scratch_queues(False)
+    assert "EphemeralVolume" not in queue["ComputeSettings"]["LocalStorage"]
+
+
+def counted_queues(**counts):
+    compute_config = copy.deepcopy(DEFAULT_COMPUTE_CONFIG)
+    entry = compute_config["queues"][0]
+    entry.pop("max_count")
+    entry.update(counts)
+    return build_slurm_queues(
+        compute_config,
+        SUBNETS,
+        COMPUTE_SETTINGS,
+        COMMON_COMPUTE_SETTINGS,
+        STORAGE_SECURITY_GROUPS,
+        efa_security_group=EFA_SECURITY_GROUP,
+        placement_group=placement_group,
+    )
+
+
+@pytest.mark.parametrize("counts", [{}, {"max_count": "20"}, {"max_count": 0}])
+def test_max_count_must_be_a_positive_integer(counts):
+    with pytest.raises(ValueError, match="Queue 'icl1' max_count must be an integer of at least 1"):
+        counted_queues(**counts)
+
+
+def test_min_count_must_be_an_integer():
+    with pytest.raises(ValueError, match="Queue 'icl1' min_count must be an integer between 0 and max_count"):
+        counted_queues(max_count=20, min_count="2")
@@ -0,0 +1,37 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.scaling import idle_node_hours, warm_window_cron
+
+POWER_UP = (
+    "root /opt/slurm/bin/scontrol update SuspendExcNodes+=icl1-dy-c6i-[1-4] && "
+    "/opt/slurm/bin/scontrol update NodeName=icl1-dy-c6i-[1-4] State=POWER_UP"
+)
+RELEASE = "root /opt/slurm/bin/scontrol update SuspendExcNodes-=icl1-dy-c6i-[1-4]"
+
+
+def test_window_within_a_day():
+    window = {"days": "1-5", "start_hour": 8, "end_hour": 18, "nodes": 4}
+    assert warm_window_cron("icl1", "c6i", window) == [
+        f"0 8 * * 1-5 {POWER_UP}",
+        f"0 18 * * 1-5 {RELEASE}",
+    ]
+
+
+@pytest.mark.parametrize(
+    "days,end_days",
+    [("5", "6"), ("1-5", "2,3,4,5,6"), ("6", "0"), ("0,6", "0,1")],
+)
+def test_window_ending_at_midnight_releases_the_next_day(days, end_days):
+    window = {"days": days, "start_hour": 20, "end_hour": 24, "nodes": 4}
+    assert warm_window_cron("icl1", "c6i", window) == [
+        f"0 20 * * {days} {POWER_UP}",
+        f"0 0 * * {end_days} {RELEASE}",
+    ]
+
+
+def test_idle_node_hours():
+    windows = [{"days": "1-5", "start_hour": 8, "end_hour": 18, "nodes": 4}]
+    assert idle_node_hours(1, windows) == 1 * 24 * 7 + 4 * 10 * 5
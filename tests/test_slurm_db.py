@@ -0,0 +1,19 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.slurm_db import DEFAULT_SLURM_DB_CONFIG, slurm_db_config
+
+
+def test_no_database_without_slurm_db():
+    assert slurm_db_config({}) is None
+
+
+def test_empty_slurm_db_uses_the_defaults():
+    assert slurm_db_config({"slurm_db": {}}) == DEFAULT_SLURM_DB_CONFIG
+
+
+def test_capacity_in_half_acu_steps():
+    with pytest.raises(ValueError, match="multiple of 0.5"):
+        slurm_db_config({"slurm_db": {"max_capacity": 2.25}})
@@ -0,0 +1,53 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+import os
+
+import pytest
+from aws_cdk.assertions import Template
+
+from conftest import SNAPSHOTS_DIR, build_stacks, load_config, sample_configs
+
+from pcluster_cdk.clusters import cluster_configs, cluster_stack_id
+
+SHARED_STACKS = ("HpcNetwork", "HpcEfsStack", "HpcLustreStack", "HpcZfsStack")
+
+# Stacks only built when their config key is set, by key
+OPTIONAL_STACKS = {"images": "HpcImageBuilder", "slurm_db": "HpcSlurmDb"}
+
+
+def stack_names(config_name):
+    config = load_config(config_name)
+    optional = tuple(stack for key, stack in OPTIONAL_STACKS.items() if key in config)
+    return SHARED_STACKS + optional + tuple(
+        cluster_stack_id(config, cluster_config) for cluster_config in cluster_configs(config)
+    )
+
+
+@pytest.mark.parametrize(
+    "config_name,stack_name",
+    [
+        pytest.param(config_name, stack_name, marks=pytest.mark.xdist_group(config_name))
+        for config_name in sample_configs()
+        for stack_name in stack_names(config_name)
+    ],
+)
+def test_snapshot(config_name, stack_name, update_snapshots):
+    stacks = build_stacks(config_name)
+    snapshot_path = os.path.join(SNAPSHOTS_DIR, config_name, stack_name + ".json")
+    if stack_name not in stacks:
+        assert not os.path.exists(snapshot_path), f"{stack_name} is no longer built"
+        pytest.skip(f"{config_name} does not build {stack_name}")
+    template = Template.from_stack(stacks[stack_name]).to_json()
+
+    if update_snapshots:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        with open(snapshot_path, "w") as snapshot_json:
+            json.dump(template, snapshot_json, indent=1, sort_keys=True)
+            snapshot_json.write("\n")
+
+    if not os.path.exists(snapshot_path):
+        pytest.fail(f"No snapshot for {config_name}/{stack_name}, run pytest --update-snapshots")
+    with open(snapshot_path, "r") as snapshot_json:
+        assert template == json.load(snapshot_json)
@@ -0,0 +1,28 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import os
+
+import aws_cdk as cdk
+import pytest
+
+from pcluster_cdk.synth_profile import SynthProfiler, jsii_kernel_memory
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc")
+def test_phases_report_jsii_kernel_memory():
+    profiler = SynthProfiler(True)
+    app = cdk.App()
+    with profiler.measure("stack"):
+        cdk.Stack(app, "Stack")
+    (phase,) = profiler.phases
+    rss, peak = jsii_kernel_memory()
+    assert 0 < phase["kernel_rss_mib"] <= peak
+    assert "kernel_rss_growth_mib" in phase
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = SynthProfiler(False)
+    with profiler.measure("stack"):
+        pass
+    assert profiler.phases == []
@@ -0,0 +1,81 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import copy
+import json
+import os
+
+from pcluster_cdk.update_impact import (
+    COMPUTE_FLEET_STOP,
+    IGNORED,
+    QUEUE_UPDATE_STRATEGY,
+    SUPPORTED,
+    UNSUPPORTED,
+    update_impact,
+)
+from conftest import SNAPSHOTS_DIR
+
+
+def snapshot_cluster_config(config_name):
+    with open(os.path.join(SNAPSHOTS_DIR, config_name, "HpcCluster.json"), "r") as template_json:
+        template = json.load(template_json)
+    for resource in template["Resources"].values():
+        if resource["Type"] == "Custom::PClusterCluster":
+            return resource["Properties"]["ClusterConfiguration"]
+
+
+def queue(cluster_config, name):
+    return next(
+        queue
+        for queue in cluster_config["Scheduling"]["SlurmQueues"]
+        if queue["Name"] == name
+    )
+
+
+def test_unchanged_config_has_no_impact():
+    old = snapshot_cluster_config("default")
+    impact = update_impact(old, copy.deepcopy(old))
+    assert impact == {"policy": IGNORED, "changes": [], "queues": {}}
+
+
+def test_queue_change_drains_only_that_queue():
+    old = snapshot_cluster_config("default")
+    new = copy.deepcopy(old)
+    queue(new, "icl1")["ComputeSettings"]["LocalStorage"]["RootVolume"]["Size"] = "400"
+    queue(new, "icl2")["ComputeResources"][0]["MaxCount"] = "40"
+
+    impact = update_impact(old, new)
+    assert impact["policy"] == QUEUE_UPDATE_STRATEGY
+    assert [change["policy"] for change in impact["changes"]] == [
+        QUEUE_UPDATE_STRATEGY,
+        SUPPORTED,
+    ]
+    assert impact["queues"] == {"icl1": "drain"}
+
+
+def test_removing_a_queue_stops_the_fleet():
+    old = snapshot_cluster_config("default")
+    new = copy.deepcopy(old)
+    queue(new, "spr1")["ComputeResources"][0]["MaxCount"] = "10"
+    new["Scheduling"]["SlurmQueues"] = [
+        queue for queue in new["Scheduling"]["SlurmQueues"] if queue["Name"] != "spr3"
+    ]
+
+    impact = update_impact(old, new)
+    assert impact["policy"] == COMPUTE_FLEET_STOP
+    assert impact["queues"]["spr3"] == "removed"
+    assert impact["queues"]["spr1"] == "stop"
+
+
+def test_head_node_change_is_rejected():
+    old = snapshot_cluster_config("default")
+    new = copy.deepcopy(old)
+    new["HeadNode"]["InstanceType"] = "m7i.xlarge"
+    new["HeadNode"]["Ssh"]["AllowedIps"] = "10.0.0.0/16"
+
+    impact = update_impact(old, new)
+    assert impact["policy"] == UNSUPPORTED
+    assert {change["path"]: change["policy"] for change in impact["changes"]} == {
+        "HeadNode.InstanceType": UNSUPPORTED,
+        "HeadNode.Ssh.AllowedIps": SUPPORTED,
+    }
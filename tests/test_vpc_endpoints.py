@@ -0,0 +1,31 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import pytest
+
+from pcluster_cdk.vpc_endpoints import endpoints_config, nat_dependent_services
+
+
+def test_unknown_interface_service_is_rejected():
+    with pytest.raises(ValueError, match="'ssm-messages' is not a known interface endpoint"):
+        endpoints_config({"endpoints": {"interface": ["ssm-messages"]}})
+
+
+def test_head_node_services_do_not_depend_on_nat():
+    services = nat_dependent_services(endpoints_config({}))
+    assert "secretsmanager" not in services
+    assert "ec2" not in services
+    assert "s3" in services
+
+
+def test_covered_services_do_not_depend_on_nat():
+    endpoints = endpoints_config(
+        {"endpoints": {"gateway": ["s3", "dynamodb"], "interface": ["logs", "monitoring"]}}
+    )
+    assert set(nat_dependent_services(endpoints)) == {
+        "cloudformation",
+        "sts",
+        "ssm",
+        "ssmmessages",
+        "ec2messages",
+    }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Benchmark app.py synth and track the results across commits.
+
+Usage: python tools/benchmark_synth.py [--config config] [--runs 3] [--history synth-benchmarks.jsonl]
+
+Each run synthesizes with CDK_SYNTH_PROFILE=1 into a temporary directory.
+The median of every phase, the construct counts and template sizes are
+appended to the history file with the current commit, and compared with
+the previous entry for the same config.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from pcluster_cdk.synth_profile import PROFILE_ENV, REPORT_NAME  # noqa: E402
+
+
+def synth_once(config):
+    with tempfile.TemporaryDirectory() as outdir:
+        env = dict(
+            os.environ,
+            CDK_APP_CONFIG=config,
+            CDK_OUTDIR=outdir,
+            **{PROFILE_ENV: "1"},
+        )
+        env.setdefault("CDK_DEPLOY_ACCOUNT", "123456789012")
+        env.setdefault("CDK_DEPLOY_REGION", "us-east-1")
+        subprocess.run(
+            [sys.executable, "app.py"],
+            cwd=REPO_ROOT,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        with open(os.path.join(outdir, REPORT_NAME), "r") as report_json:
+            return json.load(report_json)
+
+
+def summarize(reports):
+    phases = {}
+    for report in reports:
+        for phase in report["phases"]:
+            phases.setdefault(phase["name"], []).append(phase["seconds"])
+    return {
+        "phases": {name: statistics.median(seconds) for name, seconds in phases.items()},
+        "total_seconds": statistics.median(report["total_seconds"] for report in reports),
+        "max_rss_mib": max(report["max_rss_mib"] for report in reports),
+        "kernel_max_rss_mib": max(
+            (report["kernel_max_rss_mib"] or 0 for report in reports), default=0
+        )
+        or None,
+        "stacks": {
+            stack["name"]: {
+                "constructs": stack["constructs"],
+                "template_bytes": stack["template_bytes"],
+            }
+            for stack in reports[-1]["stacks"]
+        },
+    }
+
+
+def git_commit():
+    return subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def previous_entry(history, config):
+    if not os.path.exists(history):
+        return None
+    previous = None
+    with open(history, "r") as history_jsonl:
+        for line in history_jsonl:
+            entry = json.loads(line)
+            if entry["config"] == config:
+                previous = entry
+    return previous
+
+
+def change(current, previous):
+    if not previous:
+        return ""
+    return f" ({(current - previous) / previous:+.0%})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="config")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--history", default=os.path.join(REPO_ROOT, "synth-benchmarks.jsonl")
+    )
+    args = parser.parse_args()
+
+    entry = dict(
+        summarize([synth_once(args.config) for _ in range(args.runs)]),
+        commit=git_commit(),
+        config=args.config,
+        runs=args.runs,
+    )
+    previous = previous_entry(args.history, args.config)
+
+    for name, seconds in entry["phases"].items():
+        before = previous and previous["phases"].get(name)
+        print(f"{name:<28} {seconds:8.2f}s{change(seconds, before)}")
+    for name, stack in entry["stacks"].items():
+        before = previous and previous["stacks"].get(name, {}).get("template_bytes")
+        print(
+            f"{name:<28} {stack['constructs']:6,} constructs "
+            f"{stack['template_bytes']:9,} bytes{change(stack['template_bytes'], before)}"
+        )
+    print(
+        f"{'total':<28} {entry['total_seconds']:8.2f}s"
+        f"{change(entry['total_seconds'], previous and previous['total_seconds'])}"
+    )
+
+    with open(args.history, "a") as history_jsonl:
+        history_jsonl.write(json.dumps(entry) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Regenerate pcluster_cdk/data/instance_types.json from the EC2 API.
+
+Usage: python tools/refresh_instance_catalog.py [--region us-east-1] [family ...]
+
+With no families, every instance type offered in the region is written;
+otherwise the listed families are merged into the existing catalog.
+Requires boto3 and credentials allowed to call ec2:DescribeInstanceTypes.
+"""
+
+import argparse
+import json
+import os
+
+import boto3
+
+CATALOG_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "pcluster_cdk", "data", "instance_types.json"
+)
+
+
+def catalog_entry(instance_type):
+    storage = instance_type.get("InstanceStorageInfo", {})
+    architectures = instance_type["ProcessorInfo"]["SupportedArchitectures"]
+    return {
+        "vcpus": instance_type["VCpuInfo"]["DefaultVCpus"],
+        "memory_mib": instance_type["MemoryInfo"]["SizeInMiB"],
+        # Instances such as p4d and p5 spread their bandwidth over several cards
+        "network_gbps": sum(
+            card["PeakBandwidthInGbps"] for card in instance_type["NetworkInfo"]["NetworkCards"]
+        ),
+        "efa": instance_type["NetworkInfo"]["EfaSupported"],
+        "instance_store_gb": storage.get("TotalSizeInGB", 0),
+        "nvme": storage.get("NvmeSupport") in ("required", "supported"),
+        "architecture": (
+            "arm64" if "arm64" in architectures else "x86_64"
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--region", default=os.environ.get("CDK_DEPLOY_REGION"))
+    parser.add_argument("families", nargs="*")
+    args = parser.parse_args()
+
+    ec2 = boto3.client("ec2", region_name=args.region)
+    filters = []
+    if args.families:
+        filters.append(
+            {"Name": "instance-type", "Values": [f"{f}.*" for f in args.families]}
+        )
+
+    catalog = {}
+    if args.families:
+        with open(CATALOG_PATH, "r") as catalog_json:
+            catalog = json.load(catalog_json)["instance_types"]
+
+    for page in ec2.get_paginator("describe_instance_types").paginate(Filters=filters):
+        for instance_type in page["InstanceTypes"]:
+            catalog[instance_type["InstanceType"]] = catalog_entry(instance_type)
+
+    with open(CATALOG_PATH, "w") as catalog_json:
+        json.dump(
+            {
+                "source": "ec2:DescribeInstanceTypes",
+                "instance_types": dict(sorted(catalog.items())),
+            },
+            catalog_json,
+            indent=1,
+        )
+        catalog_json.write("\n")
+    print(f"Wrote {len(catalog)} instance types to {os.path.normpath(CATALOG_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""Predict how a cluster update will affect the compute fleet before cdk deploy.
+
+Usage: python tools/update_impact.py PREVIOUS [NEW] [--fail-on UNSUPPORTED] [--json]
+
+PREVIOUS and NEW (default cdk.out) are cloud assembly directories or
+HpcCluster templates, for example a copy of cdk.out from the last deploy or
+the output of `aws cloudformation get-template --template-stage Processed
+--query TemplateBody`.
+The ParallelCluster configuration of each cluster is diffed and every change
+is classified with the update policies in pcluster_cdk/update_impact.py.
+Exits with status 1 when a cluster update reaches the --fail-on policy.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from pcluster_cdk.update_impact import (  # noqa: E402
+    POLICY_ORDER,
+    UNSUPPORTED,
+    render_report,
+    update_impact,
+)
+
+
+def template_cluster_configs(template_path, name):
+    with open(template_path, "r") as template_json:
+        template = json.load(template_json)
+
+    configs = {}
+    for resource in template.get("Resources", {}).values():
+        if resource["Type"] != "Custom::PClusterCluster":
+            continue
+        cluster_config = resource["Properties"]["ClusterConfiguration"]
+        if "Fn::Transform" in cluster_config:
+            cluster_config = included_config(template_path, cluster_config["Fn::Transform"])
+        configs[name] = cluster_config
+    return configs
+
+
+def included_config(template_path, transform):
+    """Offloaded configurations are the asset next to the template."""
+    location = transform["Parameters"]["Location"]
+    asset_path = os.path.join(
+        os.path.dirname(template_path), "asset." + location.rsplit("/", 1)[-1]
+    )
+    if not os.path.exists(asset_path):
+        raise ValueError(f"Cluster configuration {location} is not in {os.path.dirname(template_path)}")
+    with open(asset_path, "r") as asset_json:
+        return json.load(asset_json)
+
+
+def cluster_configs(path):
+    """Cluster configurations by stack name from an assembly or a template."""
+    if not os.path.isdir(path):
+        name = os.path.basename(path).split(".")[0]
+        return template_cluster_configs(path, name)
+
+    with open(os.path.join(path, "manifest.json"), "r") as manifest_json:
+        artifacts = json.load(manifest_json)["artifacts"]
+    configs = {}
+    for name, artifact in artifacts.items():
+        if artifact["type"] == "aws:cloudformation:stack":
+            configs.update(
+                template_cluster_configs(
+                    os.path.join(path, artifact["properties"]["templateFile"]), name
+                )
+            )
+    return configs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("previous")
+    parser.add_argument("new", nargs="?", default=os.path.join(REPO_ROOT, "cdk.out"))
+    parser.add_argument("--fail-on", choices=POLICY_ORDER[1:], default=UNSUPPORTED)
+    parser.add_argument("--json", action="store_true", help="Print the impact as JSON")
+    args = parser.parse_args()
+
+    previous = cluster_configs(args.previous)
+    new = cluster_configs(args.new)
+    # A single template has no stack name to pair on
+    if len(previous) == len(new) == 1 and not os.path.isdir(args.previous):
+        previous = {name: config for name, config in zip(new, previous.values())}
+
+    impacts = {
+        name: update_impact(previous[name], config)
+        for name, config in new.items()
+        if name in previous
+    }
+    if args.json:
+        print(json.dumps(impacts, indent=2))
+    else:
+        for name, impact in impacts.items():
+            print(render_report(name, impact))
+        for name in sorted(set(new) - set(previous)):
+            print(f"{name}: new cluster")
+        for name in sorted(set(previous) - set(new)):
+            print(f"{name}: no longer synthesized, the retained cluster is left running")
+
+    threshold = POLICY_ORDER.index(args.fail_on)
+    if any(POLICY_ORDER.index(impact["policy"]) >= threshold for impact in impacts.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()